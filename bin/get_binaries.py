@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 
 import argparse
-from shutil import copy2
+import shutil
 import platform
 import os
 
@@ -30,6 +30,12 @@ MAC_FILES = [
     "libtbbmalloc.dylib", "libtiff.5.dylib", "libnvrtc.dylib", "libcuda.dylib", "pyluxcore.so", "pyluxcoretools.zip", "oidnDenoise"
 ]
 
+FILES_BY_SYSTEM = {
+    "Linux": LINUX_FILES,
+    "Windows": WINDOWS_FILES,
+    "Darwin": MAC_FILES,
+}
+
 
 def confirm(message):
     while True:
@@ -40,6 +46,85 @@ def confirm(message):
             print("\nValid answers: y/n")
 
 
+COPY_BUFFER_SIZE = 1024 * 1024
+SYSTEM = platform.system()
+
+
+def _copy_sendfile(src_file, dst_file):
+    # The data is copied inside the kernel, without going through user space
+    src_fd = src_file.fileno()
+    dst_fd = dst_file.fileno()
+    size = os.fstat(src_fd).st_size
+    offset = 0
+    while offset < size:
+        sent = os.sendfile(dst_fd, src_fd, offset, size - offset)
+        if sent == 0:
+            break
+        offset += sent
+
+
+def _copy_buffered(src_file, dst_file):
+    buffer = bytearray(COPY_BUFFER_SIZE)
+    view = memoryview(buffer)
+    while True:
+        read = src_file.readinto(buffer)
+        if not read:
+            break
+        dst_file.write(view[:read])
+
+
+def _copy_file(src, dst):
+    """
+    Copy the file contents with the fastest method available on this system,
+    then copy the metadata (permission bits, timestamps) like shutil.copy2 does.
+    """
+    if SYSTEM == "Linux":
+        with open(src, "rb") as src_file, open(dst, "wb") as dst_file:
+            try:
+                _copy_sendfile(src_file, dst_file)
+            except OSError:
+                # sendfile is not supported by the file system
+                src_file.seek(0)
+                dst_file.seek(0)
+                dst_file.truncate()
+                _copy_buffered(src_file, dst_file)
+    else:
+        # Uses fcopyfile on macOS and CopyFileW on Windows
+        shutil.copyfile(src, dst)
+
+    shutil.copystat(src, dst)
+
+
+def _scan(path, targets):
+    """
+    Recursively yield (path, name) tuples of files in path whose name is in targets.
+    targets is the live set of files that are still missing. Found names are removed
+    from it and the traversal stops as soon as it is empty.
+    Like os.walk(), the files of a directory are checked before its subdirectories,
+    and symlinks to directories are not followed.
+    """
+    subdirs = []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_dir():
+                    if not entry.is_symlink():
+                        subdirs.append(entry.path)
+                elif entry.name in targets:
+                    targets.discard(entry.name)
+                    yield entry.path, entry.name
+
+                    if not targets:
+                        return
+    except OSError:
+        return
+
+    for subdir in subdirs:
+        yield from _scan(subdir, targets)
+        if not targets:
+            return
+
+
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("source_path",
@@ -48,42 +133,34 @@ def main():
     parser.add_argument("--overwrite", help="Overwrite existing files without asking", action="store_true")
     args = parser.parse_args()
 
-    if platform.system() == "Linux":
-        files = LINUX_FILES
-    elif platform.system() == "Windows":
-        files = WINDOWS_FILES
-    elif platform.system() == "Darwin":
-        files = MAC_FILES
-    else:
-        print("Unsupported system:", platform.system())
-
-    for root, dirnames, filenames in os.walk(args.source_path):
-        files_in_dir = set(filenames).intersection(files)
-        found_files = []
-
-        for file in files_in_dir:
-            src = os.path.join(root, file)
-            script_dir = os.path.dirname(os.path.realpath(__file__))
-            dst = os.path.join(script_dir, file)
-
-            # Check if the file is already in BlendLuxCore/bin folder
-            if os.path.isfile(dst):
-                if args.overwrite or confirm("Overwrite " + file + "? (y/n): "):
-                    os.remove(dst)
-                    print("Copying", file, "from", root)
-                    copy2(src, dst)
-                else:
-                    print("Skipping file", file)
-            else:
-                print("Copying", file, "from", root)
-                copy2(src, dst)
+    files = FILES_BY_SYSTEM.get(SYSTEM)
+    if files is None:
+        print("Unsupported system:", SYSTEM)
+        return
 
-            found_files.append(file)
+    script_dir = os.path.dirname(os.path.realpath(__file__))
+    dst_paths = {file: os.path.join(script_dir, file) for file in files}
+    remaining = set(files)
 
-        for found_file in found_files:
-            files.remove(found_file)
+    for src, file in _scan(args.source_path, remaining):
+        root = os.path.dirname(src)
+        dst = dst_paths[file]
+
+        # Check if the file is already in BlendLuxCore/bin folder
+        if os.path.isfile(dst):
+            if args.overwrite or confirm("Overwrite " + file + "? (y/n): "):
+                os.remove(dst)
+                print("Copying", file, "from", root)
+                _copy_file(src, dst)
+            else:
+                print("Skipping file", file)
+        else:
+            print("Copying", file, "from", root)
+            _copy_file(src, dst)
 
     for file in files:
+        if file not in remaining:
+            continue
         print('ERROR: Could not find file "%s".' % file)
 
 
@@ -158,8 +158,8 @@ class Exporter(object):
             # Config props are empty: there was a critical error in config export, we can't render
             raise Exception("Errors in config, check error log")
 
-        # Init config cache (convert to string here because config_props gets changed below)
-        self.config_cache.diff(str(config_props))
+        # Init config cache (copy here because config_props gets changed below)
+        self.config_cache.diff(pyluxcore.Properties(config_props))
 
         # Imagepipeline
         imagepipeline_props = imagepipeline.convert(scene, context)
@@ -252,7 +252,7 @@ class Exporter(object):
         self.scene = None
         return pyluxcore.RenderSession(renderconfig)
 
-    def get_viewport_changes(self, depsgraph, context=None):
+    def get_viewport_changes(self, depsgraph, context=None, digest=None):
         self.scene = depsgraph.scene_eval
         changes = Change.NONE
 
@@ -260,7 +260,7 @@ class Exporter(object):
         if self.config_cache.diff(config_props):
             changes |= Change.CONFIG
 
-        if self.camera_cache.diff(self, self.scene, depsgraph, context):
+        if self.camera_cache.diff(self, self.scene, depsgraph, context, digest):
             changes |= Change.CAMERA
 
         # Do not hold reference to temporary data
@@ -275,13 +275,16 @@ class Exporter(object):
         supports_live_transform.cache_clear()
 
         if not final:
+            # Summarize the depsgraph updates once for all caches
+            digest = caches.depsgraph_digest(depsgraph)
+
             if changes is None:
-                changes = self.get_viewport_changes(depsgraph, context)
+                changes = self.get_viewport_changes(depsgraph, context, digest)
 
             if self.object_cache2.diff(depsgraph):
                 changes |= Change.OBJECT
 
-            if self.material_cache.diff(depsgraph):
+            if self.material_cache.diff(depsgraph, digest):
                 changes |= Change.MATERIAL
 
             if self.visibility_cache.diff(depsgraph, context):
@@ -290,7 +293,7 @@ class Exporter(object):
                 if self.visibility_cache.has_new_objects:
                     changes |= Change.OBJECT
 
-            if self.world_cache.diff(depsgraph):
+            if self.world_cache.diff(depsgraph, digest):
                 changes |= Change.WORLD
 
         if changes is None:
@@ -1,4 +1,5 @@
 import bpy
+from ...bin import pyluxcore
 from ... import utils
 from ...utils import EXPORTABLE_OBJECTS
 from .. import camera, material
@@ -6,35 +7,104 @@ from .. import camera, material
 from .object_cache import ObjectCache2, supports_live_transform
 
 
+# Datablock types that are summarized by depsgraph_digest()
+DIGEST_ID_TYPES = ("OBJECT", "CAMERA", "SCENE", "NODETREE", "IMAGE", "MATERIAL", "WORLD")
+DIGEST_BITS = {id_type: 1 << i for i, id_type in enumerate(DIGEST_ID_TYPES)}
+# Digest of a depsgraph without any updates
+NO_UPDATES = (0, 0)
+
+
+def depsgraph_digest(depsgraph):
+    """
+    Cheap summary of the depsgraph updates, computed once and shared by all caches.
+    :return: tuple (bitmask of the updated DIGEST_ID_TYPES, number of depsgraph updates)
+    """
+    updated_mask = 0
+    for id_type, bit in DIGEST_BITS.items():
+        if depsgraph.id_type_updated(id_type):
+            updated_mask |= bit
+    return updated_mask, len(depsgraph.updates)
+
+
+def digest_has_updates(digest, id_types):
+    mask = 0
+    for id_type in id_types:
+        mask |= DIGEST_BITS[id_type]
+    return bool(digest[0] & mask)
+
+
+def props_to_string(props):
+    """
+    Build a string with the names and values of all properties, used as cache key.
+    This reads the values from the C++ properties directly instead of formatting
+    the whole Properties object with str().
+    """
+    if props is None or isinstance(props, str):
+        return str(props)
+    return "\n".join(name + "=" + props.Get(name).GetValuesString() for name in props.GetAllNames())
+
+
 class StringCache:
     def __init__(self):
         self.props = None
+        # String representation of self.props and its hash, so they are only computed once
+        self.props_str = None
+        self.props_hash = None
 
     def diff(self, new_props):
-        props_str = str(self.props)
-        new_props_str = str(new_props)
+        if self.props is not None and new_props is self.props:
+            # The exporters always create new props, so this is the same unchanged object
+            return False
+
+        new_props_str = props_to_string(new_props)
+        new_props_hash = hash(new_props_str)
 
         if self.props is None:
             # Not initialized yet
-            self.props = new_props
-            return True
+            has_changes = True
+        else:
+            # Only compare the strings if the hashes are equal (to rule out a collision)
+            has_changes = new_props_hash != self.props_hash or new_props_str != self.props_str
 
-        has_changes = props_str != new_props_str
         self.props = new_props
+        self.props_str = new_props_str
+        self.props_hash = new_props_hash
         return has_changes
 
 
 class CameraCache:
+    # Datablock types that can influence the exported camera
+    # (camera object transform, camera data, render settings, volume node tree, bokeh image)
+    RELEVANT_ID_TYPES = ("OBJECT", "CAMERA", "SCENE", "NODETREE", "IMAGE")
+
     def __init__(self):
         self.string_cache = StringCache()
+        self.last_view_key = None
+        # Re-used on every export. The camera props themselves can't be re-used,
+        # because the string cache keeps them to compare against and to update the scene
+        self.volume_props = pyluxcore.Properties()
 
     @property
     def props(self):
         return self.string_cache.props
 
-    def diff(self, exporter, scene, depsgraph, context):
+    def diff(self, exporter, scene, depsgraph, context, digest=None):
+        if context:
+            # Viewport navigation does not show up in the depsgraph, so we check the view separately
+            view_key = self._get_view_key(context)
+            view_changed = view_key != self.last_view_key
+            self.last_view_key = view_key
+
+            if digest is None:
+                digest = depsgraph_digest(depsgraph)
+
+            if (self.props is not None and not view_changed
+                    and not digest_has_updates(digest, self.RELEVANT_ID_TYPES)):
+                # Nothing that could affect the camera has changed, skip the export
+                return False
+
         # String cache
-        camera_props = camera.convert(exporter, scene, depsgraph, context)
+        camera_props = camera.convert(exporter, scene, depsgraph, context, volume_props=self.volume_props)
         has_changes = self.string_cache.diff(camera_props)
 
         # Check camera object and data for changes
@@ -45,17 +115,48 @@ class CameraCache:
 
         return has_changes
 
+    @staticmethod
+    def _get_view_key(context):
+        region_data = context.region_data
+        space_data = context.space_data
+        return (
+            region_data.view_perspective,
+            region_data.view_matrix.copy(),
+            region_data.view_distance,
+            region_data.view_camera_zoom,
+            tuple(region_data.view_camera_offset),
+            space_data.lens,
+            space_data.shading.type,
+            space_data.use_render_border,
+            space_data.render_border_min_x,
+            space_data.render_border_max_x,
+            space_data.render_border_min_y,
+            space_data.render_border_max_y,
+            context.region.width,
+            context.region.height,
+        )
+
 
 class MaterialCache:
     def __init__(self):
-        self.changed_materials = set()
+        self.changed_materials = []
+        # Pointers of the materials in changed_materials, to avoid duplicates.
+        # (id() can't be used because Blender creates a new Python wrapper on each access)
+        self.changed_pointers = set()
+
+    def diff(self, depsgraph, digest=None):
+        if digest == NO_UPDATES:
+            return self.changed_materials
 
-    def diff(self, depsgraph):
         if depsgraph.id_type_updated("MATERIAL"):
             for dg_update in depsgraph.updates:
-                if isinstance(dg_update.id, bpy.types.Material):
-                    self.changed_materials.add(dg_update.id)
-                    print("mat update:", dg_update.id.name)
+                mat = dg_update.id
+                if isinstance(mat, bpy.types.Material):
+                    pointer = mat.as_pointer()
+                    if pointer not in self.changed_pointers:
+                        self.changed_pointers.add(pointer)
+                        self.changed_materials.append(mat)
+                        print("mat update:", mat.name)
         return self.changed_materials
 
     def update(self, exporter, depsgraph, is_viewport_render, props):
@@ -63,11 +164,12 @@ class MaterialCache:
             lux_mat_name, mat_props = material.convert(exporter, depsgraph, mat, is_viewport_render)
             props.Set(mat_props)
         self.changed_materials.clear()
+        self.changed_pointers.clear()
 
 
 class VisibilityCache:
     def __init__(self):
-        # sets containing keys
+        # frozensets containing keys
         self.last_visible_objects = None
         self.objects_to_remove = None
         
@@ -79,12 +181,14 @@ class VisibilityCache:
     def diff(self, depsgraph, context):
         visible_objs = self._get_visible_objects(depsgraph, context)
         self.objects_to_remove = self.last_visible_objects - visible_objs
-        self.has_new_objects = bool(visible_objs - self.last_visible_objects)
+        # issubset() can stop at the first new object, no need to build the difference set
+        self.has_new_objects = not visible_objs.issubset(self.last_visible_objects)
         self.last_visible_objects = visible_objs
         return bool(self.objects_to_remove) or self.has_new_objects
 
     def _get_visible_objects(self, depsgraph, context):
-        keys = set()
+        space_data = context.space_data
+        keys = []
 
         for dg_obj_instance in depsgraph.object_instances:
             if not supports_live_transform(dg_obj_instance.particle_system):
@@ -93,17 +197,21 @@ class VisibilityCache:
             if dg_obj_instance.show_self:
                 # For duplis, check visibility of parent (emitter)
                 obj = dg_obj_instance.parent if dg_obj_instance.parent else dg_obj_instance.object
-                if obj.luxcore.exclude_from_render or not obj.visible_in_viewport_get(context.space_data):
+                if obj.luxcore.exclude_from_render or not obj.visible_in_viewport_get(space_data):
                     continue
-                keys.add(utils.make_key_from_instance(dg_obj_instance))
-        return keys
+                keys.append(utils.make_key_from_instance(dg_obj_instance))
+        return frozenset(keys)
 
 
 class WorldCache:
     def __init__(self):
         self.world_name = None
 
-    def diff(self, depsgraph):
+    def diff(self, depsgraph, digest=None):
+        if digest == NO_UPDATES:
+            # A world change (including a world switch) always shows up in the depsgraph
+            return False
+
         world = depsgraph.scene_eval.world
         world_updated = False
 
@@ -112,9 +220,13 @@ class WorldCache:
             world_updated = depsgraph.id_type_updated("WORLD") or self.world_name != world.name_full
 
             # The sun influcences the world, e.g. through direction and turbidity if sky2 is used
-            if world.luxcore.light == "sky2" and depsgraph.id_type_updated("OBJECT"):
+            sun = world.luxcore.sun
+            if (not world_updated and sun and world.luxcore.light == "sky2"
+                    and depsgraph.id_type_updated("OBJECT")):
+                # Compare pointers, it's cheaper than comparing the Python wrappers
+                sun_pointer = sun.as_pointer()
                 for dg_update in depsgraph.updates:
-                    if dg_update.id == world.luxcore.sun:
+                    if dg_update.id.as_pointer() == sun_pointer:
                         world_updated = True
                         break
         elif self.world_name:
@@ -1,15 +1,30 @@
 import math
-from mathutils import Vector, Matrix
+from collections import namedtuple
+from functools import lru_cache
+from mathutils import Vector
 from ..bin import pyluxcore
 from .. import utils
 from ..nodes.output import get_active_output
 from ..utils.errorlog import LuxCoreErrorLog
 from .image import ImageExporter
 
+# Camera object, camera data and camera.data.luxcore, resolved once per export.
+# data and lux are None if the scene has no valid camera (e.g. in viewport render).
+CameraContext = namedtuple("CameraContext", ["camera", "data", "lux"])
 
-def convert(exporter, scene, depsgraph, context=None, is_camera_moving=False):
+# Constant direction vectors used to calculate the camera lookat
+_DIRECTION_FORWARD = Vector((0, 0, -1))
+_DIRECTION_UP = Vector((0, 1, 0))
+
+
+def convert(exporter, scene, depsgraph, context=None, is_camera_moving=False, volume_props=None):
+    """
+    :param volume_props: Optional pyluxcore.Properties that are cleared and re-used as temporary
+                         storage for the camera volume, to avoid allocating new ones on every call.
+    """
     prefix = "scene.camera."
     definitions = {}
+    cam_ctx = _get_camera_context(scene)
 
     if context:
         # Viewport render
@@ -20,30 +35,41 @@ def convert(exporter, scene, depsgraph, context=None, is_camera_moving=False):
         elif view_cam_type == "PERSP":
             _view_persp(scene, context, definitions)
         elif view_cam_type == "CAMERA":
-            _view_camera(scene, context, definitions)
-            _clipping(scene, definitions)
+            _view_camera(scene, context, cam_ctx, definitions)
+            _clipping(cam_ctx, definitions)
         else:
             raise NotImplementedError("Unknown context.region_data.view_perspective")
     else:
         # Final render
-        _final(scene, definitions)
-        _clipping(scene, definitions)
+        _final(scene, cam_ctx, definitions)
+        _clipping(cam_ctx, definitions)
 
-    _clipping_plane(scene, definitions)
-    _motion_blur(scene, definitions, context, is_camera_moving)
+    _clipping_plane(cam_ctx, definitions)
+    _motion_blur(cam_ctx, definitions, context, is_camera_moving)
 
     cam_props = utils.create_props(prefix, definitions)
-    cam_props.Set(_get_volume_props(exporter, scene, depsgraph))
+    cam_props.Set(_get_volume_props(exporter, cam_ctx, depsgraph, volume_props))
     return cam_props
 
 
+def _get_camera_context(scene):
+    camera = scene.camera
+
+    if not utils.is_valid_camera(camera):
+        # Viewport render should work without camera
+        return CameraContext(camera, None, None)
+
+    cam_data = camera.data
+    return CameraContext(camera, cam_data, cam_data.luxcore)
+
+
 def _view_ortho(scene, context, definitions):
-    cam_matrix = Matrix(context.region_data.view_matrix).inverted()
+    cam_matrix = context.region_data.view_matrix.inverted()
     lookat_orig, lookat_target, up_vector = _calc_lookat(cam_matrix, scene)
 
     definitions["type"] = "orthographic"
     #zoom = 1.0275 * world_scale * context.region_data.view_distance * 35 / context.space_data.lens
-    zoom = 1.0275 * context.region_data.view_distance * 35 / context.space_data.lens
+    zoom = _ortho_zoom(context.region_data.view_distance, context.space_data.lens)
 
     # Move the camera origin away from the viewport center to avoid clipping
     origin = Vector(lookat_orig)
@@ -57,7 +83,7 @@ def _view_ortho(scene, context, definitions):
 
 
 def _view_persp(scene, context, definitions):
-    cam_matrix = Matrix(context.region_data.view_matrix).inverted()
+    cam_matrix = context.region_data.view_matrix.inverted()
     lookat_orig, lookat_target, up_vector = _calc_lookat(cam_matrix, scene)
     definitions["lookat.orig"] = lookat_orig
     definitions["lookat.target"] = lookat_target
@@ -66,15 +92,28 @@ def _view_persp(scene, context, definitions):
     definitions["type"] = "perspective"    
     zoom = 2.25
 
-    definitions["fieldofview"] = math.degrees(2 * math.atan(16 / context.space_data.lens))
+    definitions["fieldofview"] = _persp_fov(context.space_data.lens)
     definitions["screenwindow"] = utils.calc_screenwindow(zoom, 0, 0, scene, context)
 
 
-def _view_camera(scene, context, definitions):
-    camera = scene.camera
+# The viewport lens and view distance rarely change between redraws, so these are cached
 
-    if camera.type != "CAMERA":
+@lru_cache(maxsize=16)
+def _persp_fov(lens):
+    return math.degrees(2 * math.atan(16 / lens))
+
+
+@lru_cache(maxsize=16)
+def _ortho_zoom(view_distance, lens):
+    return 1.0275 * view_distance * 35 / lens
+
+
+def _view_camera(scene, context, cam_ctx, definitions):
+    camera = cam_ctx.camera
+
+    if cam_ctx.data is None:
         raise Exception("%s Objects as cameras are not supported, use a CAMERA object" % camera.type)
+    cam_data = cam_ctx.data
 
     lookat_orig, lookat_target, up_vector = _calc_lookat(camera.matrix_world, scene)
     
@@ -88,28 +127,29 @@ def _view_camera(scene, context, definitions):
     #zoom = 4 / ((math.sqrt(2) + context.region_data.view_camera_zoom / 50) ** 2) / world_scale
     zoom = 4 / ((math.sqrt(2) + context.region_data.view_camera_zoom / 50) ** 2)
 
-    if camera.data.type == "ORTHO":
+    if cam_data.type == "ORTHO":
         definitions["type"] = "orthographic"
-        #zoom *= 0.5*world_scale * camera.data.ortho_scale
-        zoom *= 0.5 * camera.data.ortho_scale
-    elif camera.data.type == "PANO":
+        #zoom *= 0.5*world_scale * cam_data.ortho_scale
+        zoom *= 0.5 * cam_data.ortho_scale
+    elif cam_data.type == "PANO":
         definitions["type"] = "environment"
-    elif camera.data.type == "PERSP":
+    elif cam_data.type == "PERSP":
         definitions["type"] = "perspective"
-        definitions["fieldofview"] = math.degrees(camera.data.angle)
-        _depth_of_field(scene, definitions, context)
+        definitions["fieldofview"] = math.degrees(cam_data.angle)
+        _depth_of_field(scene, cam_ctx, definitions, context)
     else:
         raise NotImplementedError("Unknown camera.data.type")
 
     # Screenwindow
-    definitions["screenwindow"] = utils.calc_screenwindow(zoom, camera.data.shift_x, camera.data.shift_y, scene, context)
+    definitions["screenwindow"] = utils.calc_screenwindow(zoom, cam_data.shift_x, cam_data.shift_y, scene, context)
 
 
-def _final(scene, definitions):
-    camera = scene.camera
+def _final(scene, cam_ctx, definitions):
+    camera = cam_ctx.camera
 
-    if camera.type != "CAMERA":
+    if cam_ctx.data is None:
         raise Exception("%s Objects as cameras are not supported, use a CAMERA object" % camera.type)
+    cam_data = cam_ctx.data
 
     lookat_orig, lookat_target, up_vector = _calc_lookat(camera.matrix_world, scene)
     definitions["lookat.orig"] = lookat_orig
@@ -117,12 +157,12 @@ def _final(scene, definitions):
     definitions["up"] = up_vector
     zoom = 1
 
-    if camera.data.type == "ORTHO":
+    if cam_data.type == "ORTHO":
         cam_type = "orthographic"
-        #zoom = 0.5 * world_scale * camera.data.ortho_scale
-        zoom = 0.5 * camera.data.ortho_scale
+        #zoom = 0.5 * world_scale * cam_data.ortho_scale
+        zoom = 0.5 * cam_data.ortho_scale
 
-    elif camera.data.type == "PANO":
+    elif cam_data.type == "PANO":
         cam_type = "environment"
     else:
         cam_type = "perspective"
@@ -130,26 +170,28 @@ def _final(scene, definitions):
 
     # Field of view
     if cam_type == "perspective":
-        definitions["fieldofview"] = math.degrees(camera.data.angle)
-        _depth_of_field(scene, definitions)
+        definitions["fieldofview"] = math.degrees(cam_data.angle)
+        _depth_of_field(scene, cam_ctx, definitions)
 
     # screenwindow (for border rendering and camera shift)
-    definitions["screenwindow"] = utils.calc_screenwindow(zoom, camera.data.shift_x, camera.data.shift_y, scene)
+    definitions["screenwindow"] = utils.calc_screenwindow(zoom, cam_data.shift_x, cam_data.shift_y, scene)
 
 
-def _depth_of_field(scene, definitions, context=None):
-    camera = scene.camera
-    settings = camera.data.luxcore
+def _depth_of_field(scene, cam_ctx, definitions, context=None):
+    camera = cam_ctx.camera
+    cam_data = cam_ctx.data
+    settings = cam_ctx.lux
+    dof = cam_data.dof
 
-    if not camera.data.dof.use_dof or utils.in_material_shading_mode(context):
+    if not dof.use_dof or utils.in_material_shading_mode(context):
         return
 
-    definitions["lensradius"] = (camera.data.lens / 1000) / (2 * camera.data.dof.aperture_fstop)
+    definitions["lensradius"] = (cam_data.lens / 1000) / (2 * dof.aperture_fstop)
 
     if settings.use_autofocus:
         definitions["autofocus.enable"] = True
     else:
-        dof_obj = camera.data.dof.focus_object
+        dof_obj = dof.focus_object
 
         if dof_obj:
             # Use distance along camera Z direction
@@ -162,7 +204,7 @@ def _depth_of_field(scene, definitions, context=None):
 
             definitions["focaldistance"] = abs(lookat_dir.dot(dof_dir))
         else:
-            definitions["focaldistance"] = camera.data.dof.focus_distance
+            definitions["focaldistance"] = dof.focus_distance
 
     bokeh = settings.bokeh
     if bokeh.non_uniform:
@@ -196,15 +238,14 @@ def _depth_of_field(scene, definitions, context=None):
                 definitions["bokeh.distribution.type"] = "UNIFORM"
 
 
-def _clipping(scene, definitions):
-    camera = scene.camera
-    if not utils.is_valid_camera(camera):
+def _clipping(cam_ctx, definitions):
+    if cam_ctx.lux is None:
         # Viewport render should work without camera
         return
 
-    if camera.data.luxcore.use_clipping:
-        clip_start = camera.data.clip_start
-        clip_end = camera.data.clip_end
+    if cam_ctx.lux.use_clipping:
+        clip_start = cam_ctx.data.clip_start
+        clip_end = cam_ctx.data.clip_end
 
         definitions["cliphither"] = clip_start
         definitions["clipyon"] = clip_end
@@ -218,14 +259,14 @@ def _clipping(scene, definitions):
 
         if warning:
             msg = 'Camera: %s' % warning
-            LuxCoreErrorLog.add_warning(msg, obj_name=camera.name)
+            LuxCoreErrorLog.add_warning(msg, obj_name=cam_ctx.camera.name)
 
 
-def _clipping_plane(scene, definitions):
-    if not utils.is_valid_camera(scene.camera):
+def _clipping_plane(cam_ctx, definitions):
+    if cam_ctx.lux is None:
         # Viewport render should work without camera
         return
-    cam_settings = scene.camera.data.luxcore
+    cam_settings = cam_ctx.lux
 
     if cam_settings.use_clipping_plane and cam_settings.clipping_plane:
         plane = cam_settings.clipping_plane
@@ -240,12 +281,12 @@ def _clipping_plane(scene, definitions):
         definitions["clippingplane.enable"] = False
 
 
-def _motion_blur(scene, definitions, context, is_camera_moving):
-    if not utils.is_valid_camera(scene.camera):
+def _motion_blur(cam_ctx, definitions, context, is_camera_moving):
+    if cam_ctx.lux is None:
         # Viewport render should work without camera
         return
 
-    moblur_settings = scene.camera.data.luxcore.motion_blur
+    moblur_settings = cam_ctx.lux.motion_blur
     if not moblur_settings.enable:
         return
 
@@ -266,20 +307,23 @@ def _motion_blur(scene, definitions, context, is_camera_moving):
 
 
 def _calc_lookat(cam_matrix, scene):
-    lookat_orig = list(cam_matrix.to_translation())
-    lookat_target = list(cam_matrix @ Vector((0, 0, -1)))
-    up_vector = list(cam_matrix.to_3x3() @ Vector((0, 1, 0)))
+    lookat_orig = list(cam_matrix.translation)
+    lookat_target = list(cam_matrix @ _DIRECTION_FORWARD)
+    up_vector = list(cam_matrix.to_3x3() @ _DIRECTION_UP)
     return lookat_orig, lookat_target, up_vector
 
 
-def _get_volume_props(exporter, scene, depsgraph):
-    props = pyluxcore.Properties()
+def _get_volume_props(exporter, cam_ctx, depsgraph, props=None):
+    if props is None:
+        props = pyluxcore.Properties()
+    else:
+        props.Clear()
 
-    if not utils.is_valid_camera(scene.camera):
+    if cam_ctx.lux is None:
         # Viewport render should work without camera
         return props
 
-    cam_settings = scene.camera.data.luxcore
+    cam_settings = cam_ctx.lux
     volume_node_tree = cam_settings.volume
 
     if volume_node_tree:
@@ -291,7 +335,7 @@ def _get_volume_props(exporter, scene, depsgraph):
             props.Set(pyluxcore.Property("scene.camera.volume", luxcore_name))
         except Exception as error:
             msg = 'Camera: %s' % error
-            LuxCoreErrorLog.add_warning(msg, obj_name=scene.camera.name)
+            LuxCoreErrorLog.add_warning(msg, obj_name=cam_ctx.camera.name)
 
     props.Set(pyluxcore.Property("scene.camera.autovolume.enable", cam_settings.auto_volume))
     return props
@@ -1,6 +1,7 @@
 import bpy
 import tempfile
 import os
+from time import monotonic
 from .. import utils
 
 
@@ -8,28 +9,42 @@ class ImageExporter(object):
     """
     This class is a singleton
     """
+    # Temp files are only deleted in cleanup(), their paths might still be referenced
+    # by scene props that were not parsed yet or by a running session
     temp_images = {}
+    # Resolved image sequences, so the directory is not scanned again on every frame.
+    # {(filepath, library_path): (timestamp, directory_mtime, indexed_filepaths)}
+    sequence_cache = {}
+    # After this many seconds, the directory mtime is checked to see if the sequence changed
+    SEQUENCE_CACHE_TTL = 1
 
-    @classmethod
-    def _save_to_temp_file(cls, image):
+    @staticmethod
+    def _get_temp_key(image):
         # Note: We can't use utils.make_key(image) here because the memory address
-        # might be re-used on undo, causing a key collision
+        # might be re-used on undo, causing a key collision.
+        # The library path is part of the key because linked images can have the same name.
+        library_path = image.library.filepath if image.library else ""
+        return library_path, image.filepath_raw or image.name_full
+
+    @staticmethod
+    def _get_temp_extension(image):
         if image.filepath_raw:
-            key = image.filepath_raw
+            _, extension = os.path.splitext(image.filepath_raw)
         else:
-            key = image.name
+            # Generated images do not have a filepath, fallback to file_format
+            extension = "." + image.file_format.lower()
+        return extension
+
+    @classmethod
+    def _save_to_temp_file(cls, image):
+        key = cls._get_temp_key(image)
 
         if key in cls.temp_images:
             # Image was already exported
             temp_image = cls.temp_images[key]
         else:
-            if image.filepath_raw:
-                _, extension = os.path.splitext(image.filepath_raw)
-            else:
-                # Generated images do not have a filepath, fallback to file_format
-                extension = "." + image.file_format.lower()
-
-            temp_image = tempfile.NamedTemporaryFile(delete=False, suffix=extension)
+            # The temp file is only created when the image is actually exported
+            temp_image = tempfile.NamedTemporaryFile(delete=False, suffix=cls._get_temp_extension(image))
 
             print('Unpacking image "%s" to temp file "%s"' % (image.name, temp_image.name))
             orig_filepath = image.filepath_raw
@@ -50,67 +65,107 @@ class ImageExporter(object):
         return temp_image.name
 
     @classmethod
-    def export(cls, image, image_user, scene):
-        if image.source == "GENERATED":
-            return cls._save_to_temp_file(image)
-        elif image.source == "FILE":
-            if image.packed_file:
-                return cls._save_to_temp_file(image)
-            else:
-                try:
-                    filepath = utils.get_abspath(image.filepath, library=image.library,
-                                                 must_exist=True, must_be_existing_file=True)
-                    return filepath
-                except OSError as error:
-                    # Make the error message more precise
-                    raise OSError('Could not find image "%s" at path "%s" (%s)'
-                                  % (image.name, image.filepath, error))
-        elif image.source == "SEQUENCE":
-            # Note: image sequences can never be packed
-            try:
-                frame = image_user.get_frame(scene)
-            except ValueError as error:
-                raise OSError(str(error))
+    def _resolve_sequence(cls, image):
+        library_path = image.library.filepath if image.library else ""
+        key = (image.filepath, library_path)
+        now = monotonic()
+        cached = cls.sequence_cache.get(key)
 
-            indexed_filepaths = utils.image_sequence_resolve_all(image)
-            try:
-                if frame < 1:
-                    raise IndexError
-                index, filepath = indexed_filepaths[frame - 1]
-                return filepath
-            except IndexError:
-                raise OSError('Frame %d in image sequence "%s" does not exist (contains only %d frames)'
-                              % (frame, image.name, len(indexed_filepaths)))
-        else:
-            raise Exception('Unsupported image source "%s" in image "%s"' % (image.source, image.name))
+        if cached:
+            timestamp, dir_mtime, indexed_filepaths = cached
+            if now - timestamp < cls.SEQUENCE_CACHE_TTL:
+                return indexed_filepaths
+
+        basedir = os.path.dirname(utils.get_abspath(image.filepath, image.library))
+        try:
+            current_dir_mtime = os.path.getmtime(basedir)
+        except OSError:
+            current_dir_mtime = None
+
+        if cached and current_dir_mtime is not None and current_dir_mtime == dir_mtime:
+            # Directory contents did not change, the cached sequence is still valid
+            cls.sequence_cache[key] = (now, dir_mtime, indexed_filepaths)
+            return indexed_filepaths
+
+        indexed_filepaths = utils.image_sequence_resolve_all(image)
+        cls.sequence_cache[key] = (now, current_dir_mtime, indexed_filepaths)
+        return indexed_filepaths
+
+    @classmethod
+    def export(cls, image, image_user, scene, support_sequence=True):
+        source = image.source
+        exporter = _EXPORTERS.get(source)
+
+        if exporter is None or (source == "SEQUENCE" and not support_sequence):
+            raise Exception('Unsupported image source "%s" in image "%s"' % (source, image.name))
+
+        return exporter(cls, image, image_user, scene)
 
     @classmethod
     def export_cycles_node_reader(cls, image):
-        # TODO deduplicate code, support image sequences
-        if image.source == "GENERATED":
-            return cls._save_to_temp_file(image)
-        elif image.source == "FILE":
-            if image.packed_file:
-                return cls._save_to_temp_file(image)
-            else:
-                try:
-                    filepath = utils.get_abspath(image.filepath, library=image.library,
-                                                 must_exist=True, must_be_existing_file=True)
-                    return filepath
-                except OSError as error:
-                    # Make the error message more precise
-                    raise OSError('Could not find image "%s" at path "%s" (%s)'
-                                  % (image.name, image.filepath, error))
-        else:
-            raise Exception('Unsupported image source "%s" in image "%s"' % (image.source, image.name))
+        # TODO support image sequences
+        return cls.export(image, None, None, support_sequence=False)
+
+    @staticmethod
+    def _delete_temp_file(temp_image):
+        filepath = temp_image.name
+        temp_image.close()
+        print("Deleting temporary image:", filepath)
+        try:
+            os.remove(filepath)
+        except FileNotFoundError:
+            pass
 
     @classmethod
     def cleanup(cls):
+        # Note: called on exit by handlers/exit.py
         for temp_image in cls.temp_images.values():
-            filepath = temp_image.name
-            temp_image.close()
-            print("Deleting temporary image:", filepath)
-            os.remove(filepath)
+            cls._delete_temp_file(temp_image)
 
         cls.temp_images.clear()
+        cls.sequence_cache.clear()
+
+
+def _export_generated(cls, image, image_user, scene):
+    return cls._save_to_temp_file(image)
+
+
+def _export_file(cls, image, image_user, scene):
+    if image.packed_file:
+        return cls._save_to_temp_file(image)
+
+    try:
+        filepath = utils.get_abspath(image.filepath, library=image.library,
+                                     must_exist=True, must_be_existing_file=True)
+        return filepath
+    except OSError as error:
+        # Make the error message more precise
+        raise OSError('Could not find image "%s" at path "%s" (%s)'
+                      % (image.name, image.filepath, error))
+
+
+def _export_sequence(cls, image, image_user, scene):
+    # Note: image sequences can never be packed
+    try:
+        frame = image_user.get_frame(scene)
+    except ValueError as error:
+        raise OSError(str(error))
+
+    indexed_filepaths = cls._resolve_sequence(image)
+    try:
+        if frame < 1:
+            raise IndexError
+        index, filepath = indexed_filepaths[frame - 1]
+        return filepath
+    except IndexError:
+        raise OSError('Frame %d in image sequence "%s" does not exist (contains only %d frames)'
+                      % (frame, image.name, len(indexed_filepaths)))
+
+
+# Maps image.source to the function that exports it
+_EXPORTERS = {
+    "GENERATED": _export_generated,
+    "FILE": _export_file,
+    "SEQUENCE": _export_sequence,
+}
 
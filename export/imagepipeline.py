@@ -1,4 +1,3 @@
-from collections import OrderedDict
 from ..bin import pyluxcore
 from .. import utils
 from .image import ImageExporter
@@ -8,23 +7,12 @@ from ..utils.errorlog import LuxCoreErrorLog
 def convert(scene, context=None, index=0):
     try:
         prefix = "film.imagepipelines.%03d." % index
-        definitions = OrderedDict()
+        definitions = {}
 
-        if utils.in_material_shading_mode(context):
-            index = _output_switcher(definitions, 0, "ALBEDO")
-            _exposure_compensated_tonemapper(definitions, index, scene)
-            return utils.create_props(prefix, definitions)
-
-        if utils.using_photongi_debug_mode(context, scene):
-            _exposure_compensated_tonemapper(definitions, 0, scene)
-            return utils.create_props(prefix, definitions)
-
-        if not utils.is_valid_camera(scene.camera):
-            # Can not work without a camera
-            _fallback(definitions)
-            return utils.create_props(prefix, definitions)
-
-        convert_defs(context, scene, definitions, 0)
+        if context:
+            _convert_viewport(context, scene, definitions)
+        else:
+            _convert_final(scene, definitions)
 
         return utils.create_props(prefix, definitions)
     except Exception as error:
@@ -34,6 +22,34 @@ def convert(scene, context=None, index=0):
         return pyluxcore.Properties()
 
 
+def _convert_final(scene, definitions):
+    # The PhotonGI debug mode is only available in final render
+    if utils.using_photongi_debug_mode(False, scene):
+        _exposure_compensated_tonemapper(definitions, 0, scene)
+        return
+
+    if not utils.is_valid_camera(scene.camera):
+        # Can not work without a camera
+        _fallback(definitions)
+        return
+
+    convert_defs(None, scene, definitions, 0)
+
+
+def _convert_viewport(context, scene, definitions):
+    if utils.in_material_shading_mode(context):
+        index = _output_switcher(definitions, 0, "ALBEDO")
+        _exposure_compensated_tonemapper(definitions, index, scene)
+        return
+
+    if not utils.is_valid_camera(scene.camera):
+        # Can not work without a camera
+        _fallback(definitions)
+        return
+
+    convert_defs(context, scene, definitions, 0)
+
+
 def convert_defs(context, scene, definitions, plugin_index, define_radiancescales=True):
     pipeline = scene.camera.data.luxcore.imagepipeline
     using_filesaver = utils.using_filesaver(context, scene)
@@ -41,48 +57,61 @@ def convert_defs(context, scene, definitions, plugin_index, define_radiancescale
     index = plugin_index
 
     # Make sure the imagepipeline does nothing when no plugins are enabled
-    definitions[str(index) + ".type"] = "NOP"
+    definitions[f"{index}.type"] = "NOP"
     index += 1
 
-    if pipeline.tonemapper.enabled:
-        index = convert_tonemapper(definitions, index, pipeline.tonemapper)
-
-    if context and scene.luxcore.viewport.get_denoiser(context) == "OPTIX":
-        definitions[str(index) + ".type"] = "OPTIX_DENOISER"
-        definitions[str(index) + ".sharpness"] = 0
-        definitions[str(index) + ".minspp"] = scene.luxcore.viewport.min_samples
+    tonemapper = pipeline.tonemapper
+    if tonemapper.enabled:
+        index = convert_tonemapper(definitions, index, tonemapper)
+
+    # The viewport denoiser is never used in final renders
+    viewport = scene.luxcore.viewport
+    denoiser = viewport.get_denoiser(context) if context else None
+    if denoiser == "OPTIX":
+        prefix = f"{index}."
+        definitions[prefix + "type"] = "OPTIX_DENOISER"
+        definitions[prefix + "sharpness"] = 0
+        definitions[prefix + "minspp"] = viewport.min_samples
         index += 1
 
-    if use_backgroundimage(context, scene):
+    if use_backgroundimage(context, scene, pipeline):
         # Note: Blender expects the alpha to be NOT premultiplied, so we only
         # premultiply it when the backgroundimage plugin is used
         index = _premul_alpha(definitions, index)
         index = _backgroundimage(definitions, index, pipeline.backgroundimage, scene)
 
-    if pipeline.mist.is_enabled(context):
-        index = _mist(definitions, index, pipeline.mist)
+    mist = pipeline.mist
+    if mist.is_enabled(context):
+        index = _mist(definitions, index, mist)
 
-    if pipeline.bloom.is_enabled(context):
-        index = _bloom(definitions, index, pipeline.bloom)
+    bloom = pipeline.bloom
+    if bloom.is_enabled(context):
+        index = _bloom(definitions, index, bloom)
 
-    if pipeline.coloraberration.is_enabled(context):
-        index = _coloraberration(definitions, index, pipeline.coloraberration)
+    coloraberration = pipeline.coloraberration
+    if coloraberration.is_enabled(context):
+        index = _coloraberration(definitions, index, coloraberration)
 
-    if pipeline.vignetting.is_enabled(context):
-        index = _vignetting(definitions, index, pipeline.vignetting)
+    vignetting = pipeline.vignetting
+    if vignetting.is_enabled(context):
+        index = _vignetting(definitions, index, vignetting)
 
-    if pipeline.white_balance.is_enabled(context):
-        index = _white_balance(definitions, index, pipeline.white_balance)
+    white_balance = pipeline.white_balance
+    if white_balance.is_enabled(context):
+        index = _white_balance(definitions, index, white_balance)
 
-    if pipeline.camera_response_func.is_enabled(context):
-        index = _camera_response_func(definitions, index, pipeline.camera_response_func, scene)
+    camera_response_func = pipeline.camera_response_func
+    if camera_response_func.is_enabled(context):
+        index = _camera_response_func(definitions, index, camera_response_func, scene)
 
     gamma_corrected = False
-    if pipeline.color_LUT.is_enabled(context):
-        index, gamma_corrected = _color_LUT(definitions, index, pipeline.color_LUT, scene)
+    color_LUT = pipeline.color_LUT
+    if color_LUT.is_enabled(context):
+        index, gamma_corrected = _color_LUT(definitions, index, color_LUT, scene)
 
-    if pipeline.contour_lines.is_enabled(context):
-        index = _contour_lines(definitions, index, pipeline.contour_lines)
+    contour_lines = pipeline.contour_lines
+    if contour_lines.is_enabled(context):
+        index = _contour_lines(definitions, index, contour_lines)
 
     if using_filesaver and not gamma_corrected:
         # Needs gamma correction (Blender applies it for us,
@@ -95,54 +124,81 @@ def convert_defs(context, scene, definitions, plugin_index, define_radiancescale
     return index
 
 
-def use_backgroundimage(context, scene):
-    viewport_in_camera_view = context and context.region_data.view_perspective == "CAMERA"
-    final_render = not context
-    pipeline = scene.camera.data.luxcore.imagepipeline
-    return pipeline.backgroundimage.is_enabled(context) and (final_render or viewport_in_camera_view)
+def use_backgroundimage(context, scene, pipeline=None):
+    # In the viewport, the background image is only shown in camera view
+    if context and context.region_data.view_perspective != "CAMERA":
+        return False
+    if pipeline is None:
+        pipeline = scene.camera.data.luxcore.imagepipeline
+    return pipeline.backgroundimage.is_enabled(context)
 
 
 def _fallback(definitions):
     """
     Fallback imagepipeline if no camera is in the scene
     """
-    index = 0
-    definitions[str(index) + ".type"] = "TONEMAP_LINEAR"
-    definitions[str(index) + ".scale"] = 1
+    prefix = "0."
+    definitions[prefix + "type"] = "TONEMAP_LINEAR"
+    definitions[prefix + "scale"] = 1
 
 
 def _exposure_compensated_tonemapper(definitions, index, scene):
-    definitions[str(index) + ".type"] = "TONEMAP_LINEAR"
-    definitions[str(index) + ".scale"] = 1 / pow(2, (scene.view_settings.exposure))
+    prefix = f"{index}."
+    definitions[prefix + "type"] = "TONEMAP_LINEAR"
+    definitions[prefix + "scale"] = 2.0 ** -scene.view_settings.exposure
     return index + 1
 
 
 def convert_tonemapper(definitions, index, tonemapper):
     # If "Auto Brightness" is enabled, put an autolinear tonemapper
     # in front of the linear tonemapper
-    if tonemapper.type == "TONEMAP_LINEAR" and tonemapper.use_autolinear:
-        definitions[str(index) + ".type"] = "TONEMAP_AUTOLINEAR"
+    tonemapper_type = tonemapper.type
+    if tonemapper_type == "TONEMAP_LINEAR" and tonemapper.use_autolinear:
+        definitions[f"{index}.type"] = "TONEMAP_AUTOLINEAR"
         index += 1
 
     # Main tonemapper
-    definitions[str(index) + ".type"] = tonemapper.type
-
-    if tonemapper.type == "TONEMAP_LINEAR":
-        definitions[str(index) + ".scale"] = tonemapper.linear_scale
-    elif tonemapper.type == "TONEMAP_REINHARD02":
-        definitions[str(index) + ".prescale"] = tonemapper.reinhard_prescale
-        definitions[str(index) + ".postscale"] = tonemapper.reinhard_postscale
-        definitions[str(index) + ".burn"] = tonemapper.reinhard_burn
-    elif tonemapper.type == "TONEMAP_LUXLINEAR":
-        definitions[str(index) + ".fstop"] = tonemapper.fstop
-        definitions[str(index) + ".exposure"] = tonemapper.exposure
-        definitions[str(index) + ".sensitivity"] = tonemapper.sensitivity
+    prefix = f"{index}."
+    definitions[prefix + "type"] = tonemapper_type
+
+    export_settings = _TONEMAPPER_SETTINGS.get(tonemapper_type)
+    if export_settings:
+        export_settings(definitions, prefix, tonemapper)
 
     return index + 1
 
 
+def _tonemapper_linear(definitions, prefix, tonemapper):
+    definitions[prefix + "scale"] = tonemapper.linear_scale
+
+
+def _tonemapper_reinhard02(definitions, prefix, tonemapper):
+    definitions.update({
+        prefix + "prescale": tonemapper.reinhard_prescale,
+        prefix + "postscale": tonemapper.reinhard_postscale,
+        prefix + "burn": tonemapper.reinhard_burn,
+    })
+
+
+def _tonemapper_luxlinear(definitions, prefix, tonemapper):
+    definitions.update({
+        prefix + "fstop": tonemapper.fstop,
+        prefix + "exposure": tonemapper.exposure,
+        prefix + "sensitivity": tonemapper.sensitivity,
+    })
+
+
+# Maps tonemapper.type to the function that exports its settings
+_TONEMAPPER_SETTINGS = {
+    "TONEMAP_LINEAR": _tonemapper_linear,
+    "TONEMAP_REINHARD02": _tonemapper_reinhard02,
+    "TONEMAP_LUXLINEAR": _tonemapper_luxlinear,
+}
+
+
 def _premul_alpha(definitions, index):
-    definitions[str(index) + ".type"] = "PREMULTIPLY_ALPHA"
+    prefix = f"{index}."
+    definitions[prefix + "type"] = "PREMULTIPLY_ALPHA"
     return index + 1
 
 
@@ -159,52 +215,69 @@ def _backgroundimage(definitions, index, backgroundimage, scene):
         # Skip this plugin
         return index
 
-    definitions[str(index) + ".type"] = "BACKGROUND_IMG"
-    definitions[str(index) + ".file"] = filepath
-    definitions[str(index) + ".gamma"] = backgroundimage.gamma
-    definitions[str(index) + ".storage"] = backgroundimage.storage
+    prefix = f"{index}."
+    definitions.update({
+        prefix + "type": "BACKGROUND_IMG",
+        prefix + "file": filepath,
+        prefix + "gamma": backgroundimage.gamma,
+        prefix + "storage": backgroundimage.storage,
+    })
     return index + 1
 
 
 def _mist(definitions, index, mist):
-    definitions[str(index) + ".type"] = "MIST"
-    definitions[str(index) + ".color"] = list(mist.color)
-    definitions[str(index) + ".amount"] = mist.amount / 100
-    definitions[str(index) + ".startdistance"] = mist.start_distance
-    definitions[str(index) + ".enddistance"] = mist.end_distance
-    definitions[str(index) + ".excludebackground"] = mist.exclude_background
+    prefix = f"{index}."
+    definitions.update({
+        prefix + "type": "MIST",
+        # pyluxcore.Property accepts lists, but not tuples or Blender color/array types
+        prefix + "color": list(mist.color),
+        prefix + "amount": mist.amount / 100,
+        prefix + "startdistance": mist.start_distance,
+        prefix + "enddistance": mist.end_distance,
+        prefix + "excludebackground": mist.exclude_background,
+    })
     return index + 1
 
 
 def _bloom(definitions, index, bloom):
-    definitions[str(index) + ".type"] = "BLOOM"
-    definitions[str(index) + ".radius"] = bloom.radius / 100
-    definitions[str(index) + ".weight"] = bloom.weight / 100
+    prefix = f"{index}."
+    definitions.update({
+        prefix + "type": "BLOOM",
+        prefix + "radius": bloom.radius / 100,
+        prefix + "weight": bloom.weight / 100,
+    })
     return index + 1
 
 
 def _coloraberration(definitions, index, coloraberration):
-    definitions[str(index) + ".type"] = "COLOR_ABERRATION"
+    prefix = f"{index}."
+    definitions[prefix + "type"] = "COLOR_ABERRATION"
     amount_x = coloraberration.amount / 100
     amount_y = coloraberration.amount_y / 100
     if coloraberration.uniform:
-        definitions[str(index) + ".amount"] = amount_x
+        definitions[prefix + "amount"] = amount_x
     else:
-        definitions[str(index) + ".amount"] = [amount_x, amount_y]
+        definitions[prefix + "amount"] = [amount_x, amount_y]
     return index + 1
 
 
 def _vignetting(definitions, index, vignetting):
-    definitions[str(index) + ".type"] = "VIGNETTING"
-    definitions[str(index) + ".scale"] = vignetting.scale / 100
+    prefix = f"{index}."
+    definitions.update({
+        prefix + "type": "VIGNETTING",
+        prefix + "scale": vignetting.scale / 100,
+    })
     return index + 1
 
 
 def _white_balance(definitions, index, white_balance):
-    definitions[str(index) + ".type"] = "WHITE_BALANCE"
-    definitions[str(index) + ".temperature"] = white_balance.temperature
-    definitions[str(index) + ".reverse"] = white_balance.reverse
-    definitions[str(index) + ".normalize"] = True
+    prefix = f"{index}."
+    definitions.update({
+        prefix + "type": "WHITE_BALANCE",
+        prefix + "temperature": white_balance.temperature,
+        prefix + "reverse": white_balance.reverse,
+        prefix + "normalize": True,
+    })
     return index + 1
 
 
@@ -226,8 +299,9 @@ def _camera_response_func(definitions, index, camera_response_func, scene):
 
     # Note: preset or file are empty strings until the user selects something
     if name:
-        definitions[str(index) + ".type"] = "CAMERA_RESPONSE_FUNC"
-        definitions[str(index) + ".name"] = name
+        prefix = f"{index}."
+        definitions[prefix + "type"] = "CAMERA_RESPONSE_FUNC"
+        definitions[prefix + "name"] = name
         return index + 1
     else:
         return index
@@ -249,32 +323,40 @@ def _color_LUT(definitions, index, color_LUT, scene):
         if gamma_corrected:
             index = _gamma(definitions, index)
 
-        definitions[str(index) + ".type"] = "COLOR_LUT"
-        definitions[str(index) + ".file"] = filepath
-        definitions[str(index) + ".strength"] = color_LUT.strength / 100
+        prefix = f"{index}."
+        definitions.update({
+            prefix + "type": "COLOR_LUT",
+            prefix + "file": filepath,
+            prefix + "strength": color_LUT.strength / 100,
+        })
         return index + 1, gamma_corrected
     else:
         return index, False
 
 
 def _contour_lines(definitions, index, contour_lines):
-    definitions[str(index) + ".type"] = "CONTOUR_LINES"
-    definitions[str(index) + ".range"] = contour_lines.contour_range
-    definitions[str(index) + ".scale"] = contour_lines.scale
-    definitions[str(index) + ".steps"] = contour_lines.steps
-    definitions[str(index) + ".zerogridsize"] = contour_lines.zero_grid_size
+    prefix = f"{index}."
+    definitions.update({
+        prefix + "type": "CONTOUR_LINES",
+        prefix + "range": contour_lines.contour_range,
+        prefix + "scale": contour_lines.scale,
+        prefix + "steps": contour_lines.steps,
+        prefix + "zerogridsize": contour_lines.zero_grid_size,
+    })
     return index + 1
 
 
 def _gamma(definitions, index):
-    definitions[str(index) + ".type"] = "GAMMA_CORRECTION"
-    definitions[str(index) + ".value"] = 2.2
+    prefix = f"{index}."
+    definitions[prefix + "type"] = "GAMMA_CORRECTION"
+    definitions[prefix + "value"] = 2.2
     return index + 1
 
 
 def _output_switcher(definitions, index, channel):
-    definitions[str(index) + ".type"] = "OUTPUT_SWITCHER"
-    definitions[str(index) + ".channel"] = channel
+    prefix = f"{index}."
+    definitions[prefix + "type"] = "OUTPUT_SWITCHER"
+    definitions[prefix + "channel"] = channel
     return index + 1
 
 
@@ -283,16 +365,17 @@ def _lightgroups(definitions, scene):
 
     _lightgroup(definitions, lightgroups.default, 0)
 
-    for i, group in enumerate(lightgroups.custom):
-        # +1 to group_id because default group is id 0, but not in the list
-        group_id = i + 1
+    # Start at 1 because the default group is id 0, but not in the list
+    for group_id, group in enumerate(lightgroups.custom, start=1):
         _lightgroup(definitions, group, group_id)
 
 
 def _lightgroup(definitions, group, group_id):
-    prefix = "radiancescales." + str(group_id) + "."
-    definitions[prefix + "enabled"] = group.enabled
-    definitions[prefix + "globalscale"] = group.gain
+    prefix = f"radiancescales.{group_id}."
+    definitions.update({
+        prefix + "enabled": group.enabled,
+        prefix + "globalscale": group.gain,
+    })
 
     if group.use_rgb_gain:
         definitions[prefix + "rgbscale"] = list(group.rgb_gain)
@@ -2,12 +2,46 @@ import bpy
 from time import time
 from .. import utils
 import array
+import numpy as np
 
+# Maps the channel name to the grid attribute in the domain settings
+_CHANNEL_ATTR = {
+    "density": "density_grid",
+    "flame": "flame_grid",
+    "heat": "heat_grid",
+    "temperature": "temperature_grid",
+    "color": "color_grid",
+    "velocity": "velocity_grid",
+}
 
-def convert(smoke_obj, channel, depsgraph):
-    start = time()
 
-    smoke_domain_mod = utils.find_smoke_domain_modifier(smoke_obj)
+def _scale_resolution_legacy(resolution, settings, channel):
+    # Note: Velocity and heat data is always low-resolution. (Comment from Cycles source code)
+    if settings.use_high_resolution and channel not in {"velocity", "heat"}:
+        return [res * (settings.amplify + 1) for res in resolution]
+    return resolution
+
+
+def _scale_resolution_noise(resolution, settings, channel):
+    if settings.use_noise:
+        return [res * settings.noise_scale for res in resolution]
+    return resolution
+
+
+# The Blender version can't change at runtime, so we pick the right function once
+_scale_resolution = _scale_resolution_legacy if bpy.app.version[:2] < (2, 82) else _scale_resolution_noise
+
+
+def convert(smoke_obj, channel, depsgraph, smoke_domain_mod=None):
+    """
+    :param smoke_domain_mod: The smoke domain modifier of smoke_obj, if the caller already looked it up
+    """
+    debug = depsgraph.scene.luxcore.debug.enabled
+    if debug:
+        start = time()
+
+    if smoke_domain_mod is None:
+        smoke_domain_mod = utils.find_smoke_domain_modifier(smoke_obj)
 
     if smoke_domain_mod is None:
         msg = 'Object "%s" is not a smoke domain' % smoke_obj.name
@@ -15,19 +49,9 @@ def convert(smoke_obj, channel, depsgraph):
 
     settings = smoke_domain_mod.domain_settings
 
-    if channel == "density":
-        grid = settings.density_grid
-    elif channel == "flame":
-        grid = settings.flame_grid
-    elif channel == "heat":
-        grid = settings.heat_grid
-    elif channel == "temperature":
-        grid = settings.temperature_grid
-    elif channel == "color":
-        grid = settings.color_grid
-    elif channel == "velocity":
-        grid = settings.velocity_grid
-    else:
+    try:
+        grid = getattr(settings, _CHANNEL_ATTR[channel])
+    except KeyError:
         raise NotImplementedError("Unknown channel type " + channel)
 
     # Prevent a crash
@@ -36,20 +60,19 @@ def convert(smoke_obj, channel, depsgraph):
         raise Exception(msg)
 
     # We have to convert Blender's bpy_prop_array because it doesn't support the Python buffer interface.
-    # We use an array instead of a list here to save a lot of memory (list would use doubles instead of floats).
-    channeldata = array.array("f", grid)
+    # foreach_get() copies the whole grid in one go, instead of iterating over each element in Python.
+    # We use float32 instead of a list here to save a lot of memory (list would use doubles instead of floats).
+    try:
+        channeldata = np.empty(len(grid), dtype=np.float32)
+        grid.foreach_get(channeldata)
+    except AttributeError:
+        # foreach_get() is not available on bpy_prop_array in old Blender versions
+        channeldata = array.array("f", grid)
 
     # The smoke resolution along the x, y, z axis
-    resolution = list(settings.domain_resolution)
+    resolution = _scale_resolution(list(settings.domain_resolution), settings, channel)
 
-    # Note: Velocity and heat data is always low-resolution. (Comment from Cycles source code)
-    if bpy.app.version[:2] < (2, 82):
-        if settings.use_high_resolution and channel not in {"velocity", "heat"}:
-            resolution = [res * (settings.amplify + 1) for res in resolution]
-    else:
-        if settings.use_noise:
-            resolution = [res * settings.noise_scale for res in resolution]
-
-    print("conversion to array took %.3f s" % (time() - start))
+    if debug:
+        print("conversion to array took %.3f s" % (time() - start))
 
     return resolution, channeldata
@@ -38,6 +38,9 @@ class LuxCoreNodeTree:
 
 class LuxCoreNode:
     """Base class for LuxCore nodes (material, volume and texture)"""
+    # No per-instance __dict__, all node data lives in Blender properties.
+    # Subclasses only benefit if they declare empty __slots__ as well.
+    __slots__ = ()
     bl_label = ""
 
     @classmethod
@@ -160,6 +163,7 @@ class LuxCoreNodeMaterial(LuxCoreNode, bpy.types.Node):
 
 class LuxCoreNodeTexture(LuxCoreNode, bpy.types.Node):
     """Base class for texture nodes"""
+    __slots__ = ()
     suffix = ""
     prefix = "scene.textures."
 
@@ -167,6 +171,28 @@ class LuxCoreNodeTexture(LuxCoreNode, bpy.types.Node):
         raise NotImplementedError("Subclasses have to implement this method!")
 
 
+class LuxCoreNodeTexBlender(LuxCoreNodeTexture):
+    """
+    Base class for the Blender procedural textures (blender_* in LuxCore).
+    Subclasses set EXPORT_TYPE and EXPORT_FIELDS, a tuple of (luxcore_key, property_name) pairs.
+    """
+    __slots__ = ()
+    EXPORT_TYPE = ""
+    EXPORT_FIELDS = ()
+
+    def export_fields(self, exporter, depsgraph, props):
+        definitions = {"type": self.EXPORT_TYPE}
+        for key, attr in self.EXPORT_FIELDS:
+            definitions[key] = getattr(self, attr)
+        # The 3D mapping is the only input of these nodes, no need to search it by name
+        definitions.update(self.inputs[0].export(exporter, depsgraph, props))
+        return definitions
+
+    def sub_export(self, exporter, depsgraph, props, luxcore_name=None, output_socket=None):
+        definitions = self.export_fields(exporter, depsgraph, props)
+        return self.create_props(props, definitions, luxcore_name)
+
+
 class LuxCoreNodeVolume(LuxCoreNode, bpy.types.Node):
     """Base class for volume nodes"""
     suffix = "vol"  # To avoid collisions with material names
@@ -1,13 +1,22 @@
 import bpy
-from bpy.props import BoolProperty, EnumProperty, FloatProperty
-from ..base import LuxCoreNodeTexture
-from ...utils import node as utils_node
+from bpy.props import EnumProperty, FloatProperty
+from ..base import LuxCoreNodeTexBlender
+from ...utils.node import force_viewport_update
 
 
-class LuxCoreNodeTexBlenderBlend(LuxCoreNodeTexture, bpy.types.Node):
+class LuxCoreNodeTexBlenderBlend(LuxCoreNodeTexBlender, bpy.types.Node):
+    __slots__ = ()
     bl_label = "Blender Blend"
     bl_width_default = 200    
 
+    EXPORT_TYPE = "blender_blend"
+    EXPORT_FIELDS = (
+        ("progressiontype", "progression_type"),
+        ("direction", "direction"),
+        ("bright", "bright"),
+        ("contrast", "contrast"),
+    )
+
     progression_items = [
         ("linear", "Linear", "linear"),
         ("quadratic", "Quadratic", "quadratic"),
@@ -23,11 +32,11 @@ class LuxCoreNodeTexBlenderBlend(LuxCoreNodeTexture, bpy.types.Node):
         ("vertical", "Vertical", "Direction: -y to y")
     ]
 
-    progression_type: EnumProperty(update=utils_node.force_viewport_update, name="Progression", description="progression", items=progression_items, default="linear")
-    direction: EnumProperty(update=utils_node.force_viewport_update, name="Direction", items=direction_items, default="horizontal")
+    progression_type: EnumProperty(update=force_viewport_update, name="Progression", description="progression", items=progression_items, default="linear")
+    direction: EnumProperty(update=force_viewport_update, name="Direction", items=direction_items, default="horizontal")
 
-    bright: FloatProperty(update=utils_node.force_viewport_update, name="Brightness", default=1.0, min=0)
-    contrast: FloatProperty(update=utils_node.force_viewport_update, name="Contrast", default=1.0, min=0)
+    bright: FloatProperty(update=force_viewport_update, name="Brightness", default=1.0, min=0)
+    contrast: FloatProperty(update=force_viewport_update, name="Contrast", default=1.0, min=0)
 
     def init(self, context):
         self.add_input("LuxCoreSocketMapping3D", "3D Mapping")
@@ -40,14 +49,3 @@ class LuxCoreNodeTexBlenderBlend(LuxCoreNodeTexture, bpy.types.Node):
         col = layout.column(align=True)
         col.prop(self, "bright")
         col.prop(self, "contrast")
-
-    def sub_export(self, exporter, depsgraph, props, luxcore_name=None, output_socket=None):
-        definitions = {
-            "type": "blender_blend",
-            "progressiontype": self.progression_type,
-            "direction": self.direction,
-            "bright": self.bright,
-            "contrast": self.contrast,
-        }
-        definitions.update(self.inputs["3D Mapping"].export(exporter, depsgraph, props))
-        return self.create_props(props, definitions, luxcore_name)
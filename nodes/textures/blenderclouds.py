@@ -1,23 +1,34 @@
 import bpy
 from bpy.props import EnumProperty, FloatProperty, IntProperty
-from ..base import LuxCoreNodeTexture
+from ..base import LuxCoreNodeTexBlender
 
 from .. import NOISE_BASIS_ITEMS, NOISE_TYPE_ITEMS, MIN_NOISE_SIZE
-from ...utils import node as utils_node
+from ...utils.node import force_viewport_update
 
 
-class LuxCoreNodeTexBlenderClouds(LuxCoreNodeTexture, bpy.types.Node):
+class LuxCoreNodeTexBlenderClouds(LuxCoreNodeTexBlender, bpy.types.Node):
+    __slots__ = ()
     bl_label = "Blender Clouds"
     bl_width_default = 200
 
-    noise_type: EnumProperty(update=utils_node.force_viewport_update, name="Noise Type", description="Soft or hard noise", items=NOISE_TYPE_ITEMS,
+    EXPORT_TYPE = "blender_clouds"
+    EXPORT_FIELDS = (
+        ("noisetype", "noise_type"),
+        ("noisebasis", "noise_basis"),
+        ("noisesize", "noise_size"),
+        ("noisedepth", "noise_depth"),
+        ("bright", "bright"),
+        ("contrast", "contrast"),
+    )
+
+    noise_type: EnumProperty(update=force_viewport_update, name="Noise Type", description="Soft or hard noise", items=NOISE_TYPE_ITEMS,
                                        default="soft_noise")
-    noise_basis: EnumProperty(update=utils_node.force_viewport_update, name="Basis", description="Basis of noise used", items=NOISE_BASIS_ITEMS,
+    noise_basis: EnumProperty(update=force_viewport_update, name="Basis", description="Basis of noise used", items=NOISE_BASIS_ITEMS,
                                         default="blender_original")
-    noise_size: FloatProperty(update=utils_node.force_viewport_update, name="Noise Size", default=0.25, min=MIN_NOISE_SIZE)
-    noise_depth: IntProperty(update=utils_node.force_viewport_update, name="Noise Depth", default=2, min=0, soft_max=10, max=25)
-    bright: FloatProperty(update=utils_node.force_viewport_update, name="Brightness", default=1.0, min=0)
-    contrast: FloatProperty(update=utils_node.force_viewport_update, name="Contrast", default=1.0, min=0)
+    noise_size: FloatProperty(update=force_viewport_update, name="Noise Size", default=0.25, min=MIN_NOISE_SIZE)
+    noise_depth: IntProperty(update=force_viewport_update, name="Noise Depth", default=2, min=0, soft_max=10, max=25)
+    bright: FloatProperty(update=force_viewport_update, name="Brightness", default=1.0, min=0)
+    contrast: FloatProperty(update=force_viewport_update, name="Contrast", default=1.0, min=0)
 
     def init(self, context):
         self.add_input("LuxCoreSocketMapping3D", "3D Mapping")
@@ -34,16 +45,3 @@ class LuxCoreNodeTexBlenderClouds(LuxCoreNodeTexture, bpy.types.Node):
         column = layout.column(align=True)
         column.prop(self, "bright")
         column.prop(self, "contrast")
-
-    def sub_export(self, exporter, depsgraph, props, luxcore_name=None, output_socket=None):
-        definitions = {
-            "type": "blender_clouds",
-            "noisetype": self.noise_type,
-            "noisebasis": self.noise_basis,
-            "noisesize": self.noise_size,
-            "noisedepth": self.noise_depth,
-            "bright": self.bright,
-            "contrast": self.contrast,
-        }
-        definitions.update(self.inputs["3D Mapping"].export(exporter, depsgraph, props))
-        return self.create_props(props, definitions, luxcore_name)
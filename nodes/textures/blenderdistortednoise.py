@@ -1,23 +1,34 @@
 import bpy
 from bpy.props import EnumProperty, FloatProperty
-from ..base import LuxCoreNodeTexture
+from ..base import LuxCoreNodeTexBlender
 
 from .. import NOISE_BASIS_ITEMS, MIN_NOISE_SIZE
-from ...utils import node as utils_node
+from ...utils.node import force_viewport_update
 
 
-class LuxCoreNodeTexBlenderDistortedNoise(LuxCoreNodeTexture, bpy.types.Node):
+class LuxCoreNodeTexBlenderDistortedNoise(LuxCoreNodeTexBlender, bpy.types.Node):
+    __slots__ = ()
     bl_label = "Blender Distorted Noise"
     bl_width_default = 200
 
-    noise_basis: EnumProperty(update=utils_node.force_viewport_update, name="Noise Basis", description="Type of noise used", items=NOISE_BASIS_ITEMS,
+    EXPORT_TYPE = "blender_distortednoise"
+    EXPORT_FIELDS = (
+        ("noise_distortion", "noise_type"),
+        ("noisebasis", "noise_basis"),
+        ("noisesize", "noise_size"),
+        ("distortion", "dist_amount"),
+        ("bright", "bright"),
+        ("contrast", "contrast"),
+    )
+
+    noise_basis: EnumProperty(update=force_viewport_update, name="Noise Basis", description="Type of noise used", items=NOISE_BASIS_ITEMS,
                                         default="blender_original")
-    noise_type: EnumProperty(update=utils_node.force_viewport_update, name="Type", description="Type of noise used", items=NOISE_BASIS_ITEMS,
+    noise_type: EnumProperty(update=force_viewport_update, name="Type", description="Type of noise used", items=NOISE_BASIS_ITEMS,
                                   default="blender_original")
-    dist_amount: FloatProperty(update=utils_node.force_viewport_update, name="Distortion", default=1.00)
-    noise_size: FloatProperty(update=utils_node.force_viewport_update, name="Noise Size", default=0.25, min=MIN_NOISE_SIZE)
-    bright: FloatProperty(update=utils_node.force_viewport_update, name="Brightness", default=1.0, min=0)
-    contrast: FloatProperty(update=utils_node.force_viewport_update, name="Contrast", default=1.0, min=0)
+    dist_amount: FloatProperty(update=force_viewport_update, name="Distortion", default=1.00)
+    noise_size: FloatProperty(update=force_viewport_update, name="Noise Size", default=0.25, min=MIN_NOISE_SIZE)
+    bright: FloatProperty(update=force_viewport_update, name="Brightness", default=1.0, min=0)
+    contrast: FloatProperty(update=force_viewport_update, name="Contrast", default=1.0, min=0)
 
     def init(self, context):
         self.add_input("LuxCoreSocketMapping3D", "3D Mapping")
@@ -34,16 +45,3 @@ class LuxCoreNodeTexBlenderDistortedNoise(LuxCoreNodeTexture, bpy.types.Node):
         column = layout.column(align=True)
         column.prop(self, "bright")
         column.prop(self, "contrast")
-
-    def sub_export(self, exporter, depsgraph, props, luxcore_name=None, output_socket=None):
-        definitions = {
-            "type": "blender_distortednoise",
-            "noise_distortion": self.noise_type,
-            "noisebasis": self.noise_basis,            
-            "noisesize": self.noise_size,
-            "distortion": self.dist_amount,
-            "bright": self.bright,
-            "contrast": self.contrast,
-        }
-        definitions.update(self.inputs["3D Mapping"].export(exporter, depsgraph, props))
-        return self.create_props(props, definitions, luxcore_name)
@@ -1,18 +1,27 @@
 import bpy
 from bpy.props import FloatProperty, IntProperty
-from ..base import LuxCoreNodeTexture
+from ..base import LuxCoreNodeTexBlender
 
-from ...utils import node as utils_node
+from ...utils.node import force_viewport_update
 
 
-class LuxCoreNodeTexBlenderMagic(LuxCoreNodeTexture, bpy.types.Node):
+class LuxCoreNodeTexBlenderMagic(LuxCoreNodeTexBlender, bpy.types.Node):
+    __slots__ = ()
     bl_label = "Blender Magic"
     bl_width_default = 200
 
-    noise_depth: IntProperty(update=utils_node.force_viewport_update, name="Noise Depth", default=2, min=0, soft_max=10, max=25)
-    turbulence: FloatProperty(update=utils_node.force_viewport_update, name="Turbulence", default=5, min=0)
-    bright: FloatProperty(update=utils_node.force_viewport_update, name="Brightness", default=1.0, min=0)
-    contrast: FloatProperty(update=utils_node.force_viewport_update, name="Contrast", default=1.0, min=0)
+    EXPORT_TYPE = "blender_magic"
+    EXPORT_FIELDS = (
+        ("noisedepth", "noise_depth"),
+        ("turbulence", "turbulence"),
+        ("bright", "bright"),
+        ("contrast", "contrast"),
+    )
+
+    noise_depth: IntProperty(update=force_viewport_update, name="Noise Depth", default=2, min=0, soft_max=10, max=25)
+    turbulence: FloatProperty(update=force_viewport_update, name="Turbulence", default=5, min=0)
+    bright: FloatProperty(update=force_viewport_update, name="Brightness", default=1.0, min=0)
+    contrast: FloatProperty(update=force_viewport_update, name="Contrast", default=1.0, min=0)
 
     def init(self, context):
         self.add_input("LuxCoreSocketMapping3D", "3D Mapping")
@@ -26,14 +35,3 @@ class LuxCoreNodeTexBlenderMagic(LuxCoreNodeTexture, bpy.types.Node):
         column = layout.column(align=True)
         column.prop(self, "bright")
         column.prop(self, "contrast")
-
-    def sub_export(self, exporter, depsgraph, props, luxcore_name=None, output_socket=None):
-        definitions = {
-            "type": "blender_magic",
-            "noisedepth": self.noise_depth,
-            "turbulence": self.turbulence,
-            "bright": self.bright,
-            "contrast": self.contrast,
-        }
-        definitions.update(self.inputs["3D Mapping"].export(exporter, depsgraph, props))
-        return self.create_props(props, definitions, luxcore_name)
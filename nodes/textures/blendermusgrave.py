@@ -1,14 +1,27 @@
 import bpy
 from bpy.props import EnumProperty, FloatProperty
-from ..base import LuxCoreNodeTexture
+from ..base import LuxCoreNodeTexBlender
 
 from .. import NOISE_BASIS_ITEMS, MIN_NOISE_SIZE
-from ...utils import node as utils_node
+from ...utils.node import force_viewport_update
 
-class LuxCoreNodeTexBlenderMusgrave(LuxCoreNodeTexture, bpy.types.Node):
+class LuxCoreNodeTexBlenderMusgrave(LuxCoreNodeTexBlender, bpy.types.Node):
+    __slots__ = ()
     bl_label = "Blender Musgrave"
     bl_width_default = 200    
 
+    EXPORT_TYPE = "blender_musgrave"
+    EXPORT_FIELDS = (
+        ("musgravetype", "musgrave_type"),
+        ("noisebasis", "noise_basis"),
+        ("noisesize", "noise_size"),
+        ("dimension", "h"),
+        ("lacunarity", "lacu"),
+        ("octaves", "octs"),
+        ("bright", "bright"),
+        ("contrast", "contrast"),
+    )
+
     musgrave_type_items = [
         ("multifractal", "Multifractal", ""),
         ("ridged_multifractal", "Ridged Multifractal", ""),
@@ -17,17 +30,17 @@ class LuxCoreNodeTexBlenderMusgrave(LuxCoreNodeTexture, bpy.types.Node):
         ("fbm", "FBM", ""),
     ]
 
-    musgrave_type: EnumProperty(update=utils_node.force_viewport_update, name="Noise Type", description="Type of noise used", items=musgrave_type_items, default="multifractal")
-    noise_basis: EnumProperty(update=utils_node.force_viewport_update, name="Basis", description="Basis of noise used", items=NOISE_BASIS_ITEMS, default="blender_original")
-    noise_size: FloatProperty(update=utils_node.force_viewport_update, name="Noise Size", default=0.25, min=MIN_NOISE_SIZE)
-    h: FloatProperty(update=utils_node.force_viewport_update, name="Dimension", default=1.0, min=0)
-    lacu: FloatProperty(update=utils_node.force_viewport_update, name="Lacunarity", default=2.0)
-    octs: FloatProperty(update=utils_node.force_viewport_update, name="Octaves", default=2.0, min=0)
-    offset: FloatProperty(update=utils_node.force_viewport_update, name="Offset", default=1.0)
-    gain: FloatProperty(update=utils_node.force_viewport_update, name="Gain", default=1.0, min=0)
-    iscale: FloatProperty(update=utils_node.force_viewport_update, name="Intensity", default=1.0)
-    bright: FloatProperty(update=utils_node.force_viewport_update, name="Brightness", default=1.0, min=0)
-    contrast: FloatProperty(update=utils_node.force_viewport_update, name="Contrast", default=1.0, min=0)
+    musgrave_type: EnumProperty(update=force_viewport_update, name="Noise Type", description="Type of noise used", items=musgrave_type_items, default="multifractal")
+    noise_basis: EnumProperty(update=force_viewport_update, name="Basis", description="Basis of noise used", items=NOISE_BASIS_ITEMS, default="blender_original")
+    noise_size: FloatProperty(update=force_viewport_update, name="Noise Size", default=0.25, min=MIN_NOISE_SIZE)
+    h: FloatProperty(update=force_viewport_update, name="Dimension", default=1.0, min=0)
+    lacu: FloatProperty(update=force_viewport_update, name="Lacunarity", default=2.0)
+    octs: FloatProperty(update=force_viewport_update, name="Octaves", default=2.0, min=0)
+    offset: FloatProperty(update=force_viewport_update, name="Offset", default=1.0)
+    gain: FloatProperty(update=force_viewport_update, name="Gain", default=1.0, min=0)
+    iscale: FloatProperty(update=force_viewport_update, name="Intensity", default=1.0)
+    bright: FloatProperty(update=force_viewport_update, name="Brightness", default=1.0, min=0)
+    contrast: FloatProperty(update=force_viewport_update, name="Contrast", default=1.0, min=0)
 
     def init(self, context):
         self.add_input("LuxCoreSocketMapping3D", "3D Mapping")
@@ -59,18 +72,7 @@ class LuxCoreNodeTexBlenderMusgrave(LuxCoreNodeTexture, bpy.types.Node):
         column.prop(self, "contrast")
 
     def sub_export(self, exporter, depsgraph, props, luxcore_name=None, output_socket=None):
-        definitions = {
-            "type": "blender_musgrave",
-            "musgravetype": self.musgrave_type,
-            "noisebasis": self.noise_basis,
-            "noisesize": self.noise_size,
-            "dimension": self.h,
-            "lacunarity": self.lacu,
-            "octaves": self.octs,
-            "bright": self.bright,
-            "contrast": self.contrast,
-        }
-        definitions.update(self.inputs["3D Mapping"].export(exporter, depsgraph, props))
+        definitions = self.export_fields(exporter, depsgraph, props)
 
         if self.musgrave_type in ('ridged_multifractal', 'hybrid_multifractal', 'hetero_terrain'):
             definitions["offset"] = self.offset
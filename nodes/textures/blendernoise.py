@@ -1,17 +1,25 @@
 import bpy
-from bpy.props import EnumProperty, FloatProperty, IntProperty
-from ..base import LuxCoreNodeTexture
-from ...utils import node as utils_node
+from bpy.props import FloatProperty, IntProperty
+from ..base import LuxCoreNodeTexBlender
+from ...utils.node import force_viewport_update
 from ...ui import icons
 
 
-class LuxCoreNodeTexBlenderNoise(LuxCoreNodeTexture, bpy.types.Node):
+class LuxCoreNodeTexBlenderNoise(LuxCoreNodeTexBlender, bpy.types.Node):
+    __slots__ = ()
     bl_label = "Blender Noise"
     bl_width_default = 200    
 
-    noise_depth: IntProperty(update=utils_node.force_viewport_update, name="Noise Depth", default=2, min=0, soft_max=10, max=25)
-    bright: FloatProperty(update=utils_node.force_viewport_update, name="Brightness", default=1.0, min=0)
-    contrast: FloatProperty(update=utils_node.force_viewport_update, name="Contrast", default=1.0, min=0)
+    EXPORT_TYPE = "blender_noise"
+    EXPORT_FIELDS = (
+        ("noisedepth", "noise_depth"),
+        ("bright", "bright"),
+        ("contrast", "contrast"),
+    )
+
+    noise_depth: IntProperty(update=force_viewport_update, name="Noise Depth", default=2, min=0, soft_max=10, max=25)
+    bright: FloatProperty(update=force_viewport_update, name="Brightness", default=1.0, min=0)
+    contrast: FloatProperty(update=force_viewport_update, name="Contrast", default=1.0, min=0)
 
     def init(self, context):
         self.add_input("LuxCoreSocketMapping3D", "3D Mapping")
@@ -24,13 +32,3 @@ class LuxCoreNodeTexBlenderNoise(LuxCoreNodeTexture, bpy.types.Node):
         column = layout.column(align=True)
         column.prop(self, "bright")
         column.prop(self, "contrast")
-
-    def sub_export(self, exporter, depsgraph, props, luxcore_name=None, output_socket=None):
-        definitions = {
-            "type": "blender_noise",
-            "noisedepth": self.noise_depth,
-            "bright": self.bright,
-            "contrast": self.contrast,
-        }
-        definitions.update(self.inputs["3D Mapping"].export(exporter, depsgraph, props))
-        return self.create_props(props, definitions, luxcore_name)
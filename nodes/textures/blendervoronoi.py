@@ -1,14 +1,27 @@
 import bpy
 from bpy.props import EnumProperty, FloatProperty
-from ..base import LuxCoreNodeTexture
+from ..base import LuxCoreNodeTexBlender
 from .. import MIN_NOISE_SIZE
-from ...utils import node as utils_node
+from ...utils.node import force_viewport_update
 
 
-class LuxCoreNodeTexBlenderVoronoi(LuxCoreNodeTexture, bpy.types.Node):
+class LuxCoreNodeTexBlenderVoronoi(LuxCoreNodeTexBlender, bpy.types.Node):
+    __slots__ = ()
     bl_label = "Blender Voronoi"
     bl_width_default = 200
 
+    EXPORT_TYPE = "blender_voronoi"
+    EXPORT_FIELDS = (
+        ("distmetric", "dist_metric"),
+        ("w1", "w1"),
+        ("w2", "w2"),
+        ("w3", "w3"),
+        ("w4", "w4"),
+        ("noisesize", "noise_size"),
+        ("bright", "bright"),
+        ("contrast", "contrast"),
+    )
+
     distance_items = [
         ("actual_distance", "Actual Distance", "actual distance"),
         ("distance_squared", "Distance Squared", "distance squared"),
@@ -19,16 +32,16 @@ class LuxCoreNodeTexBlenderVoronoi(LuxCoreNodeTexture, bpy.types.Node):
         ("minkovsky", "Minkowsky", "minkowsky"),
     ]
 
-    dist_metric: EnumProperty(update=utils_node.force_viewport_update, name="Distance Metric", description="Algorithm used to calculate distance of sample points to feature points",
+    dist_metric: EnumProperty(update=force_viewport_update, name="Distance Metric", description="Algorithm used to calculate distance of sample points to feature points",
                                         items=distance_items, default="actual_distance")
-    minkowsky_exp: FloatProperty(update=utils_node.force_viewport_update, name="Exponent", default=1.0)
-    noise_size: FloatProperty(update=utils_node.force_viewport_update, name="Noise Size", default=0.25, min=MIN_NOISE_SIZE)
-    w1: FloatProperty(update=utils_node.force_viewport_update, name="Weight 1", default=1.0, min=-2, max=2, subtype="FACTOR")
-    w2: FloatProperty(update=utils_node.force_viewport_update, name="Weight 2", default=0.0, min=-2, max=2, subtype="FACTOR")
-    w3: FloatProperty(update=utils_node.force_viewport_update, name="Weight 3", default=0.0, min=-2, max=2, subtype="FACTOR")
-    w4: FloatProperty(update=utils_node.force_viewport_update, name="Weight 4", default=0.0, min=-2, max=2, subtype="FACTOR")
-    bright: FloatProperty(update=utils_node.force_viewport_update, name="Brightness", default=1.0, min=0)
-    contrast: FloatProperty(update=utils_node.force_viewport_update, name="Contrast", default=1.0, min=0)
+    minkowsky_exp: FloatProperty(update=force_viewport_update, name="Exponent", default=1.0)
+    noise_size: FloatProperty(update=force_viewport_update, name="Noise Size", default=0.25, min=MIN_NOISE_SIZE)
+    w1: FloatProperty(update=force_viewport_update, name="Weight 1", default=1.0, min=-2, max=2, subtype="FACTOR")
+    w2: FloatProperty(update=force_viewport_update, name="Weight 2", default=0.0, min=-2, max=2, subtype="FACTOR")
+    w3: FloatProperty(update=force_viewport_update, name="Weight 3", default=0.0, min=-2, max=2, subtype="FACTOR")
+    w4: FloatProperty(update=force_viewport_update, name="Weight 4", default=0.0, min=-2, max=2, subtype="FACTOR")
+    bright: FloatProperty(update=force_viewport_update, name="Brightness", default=1.0, min=0)
+    contrast: FloatProperty(update=force_viewport_update, name="Contrast", default=1.0, min=0)
 
     def init(self, context):
         self.add_input("LuxCoreSocketMapping3D", "3D Mapping")
@@ -50,18 +63,7 @@ class LuxCoreNodeTexBlenderVoronoi(LuxCoreNodeTexture, bpy.types.Node):
         column.prop(self, "contrast")
 
     def sub_export(self, exporter, depsgraph, props, luxcore_name=None, output_socket=None):
-        definitions = {
-            "type": "blender_voronoi",
-            "distmetric": self.dist_metric,
-            "w1": self.w1,
-            "w2": self.w2,
-            "w3": self.w3,
-            "w4": self.w4,
-            "noisesize": self.noise_size,
-            "bright": self.bright,
-            "contrast": self.contrast,
-        }
-        definitions.update(self.inputs["3D Mapping"].export(exporter, depsgraph, props))
+        definitions = self.export_fields(exporter, depsgraph, props)
 
         if self.dist_metric == "minkovsky":
             definitions["exponent"] = self.minkowsky_exp
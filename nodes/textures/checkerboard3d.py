@@ -3,6 +3,7 @@ from ..base import LuxCoreNodeTexture
 
 
 class LuxCoreNodeTexCheckerboard3D(LuxCoreNodeTexture, bpy.types.Node):
+    __slots__ = ()
     bl_label = "3D Checkerboard"
     bl_width_default = 160
 
@@ -14,10 +15,12 @@ class LuxCoreNodeTexCheckerboard3D(LuxCoreNodeTexture, bpy.types.Node):
         self.outputs.new("LuxCoreSocketColor", "Color")
 
     def sub_export(self, exporter, depsgraph, props, luxcore_name=None, output_socket=None):
+        # Sockets in the order they are added in init()
+        color1, color2, mapping = self.inputs
         definitions = {
             "type": "checkerboard3d",
-            "texture1": self.inputs["Color 1"].export(exporter, depsgraph, props),
-            "texture2": self.inputs["Color 2"].export(exporter, depsgraph, props),
+            "texture1": color1.export(exporter, depsgraph, props),
+            "texture2": color2.export(exporter, depsgraph, props),
         }
-        definitions.update(self.inputs["3D Mapping"].export(exporter, depsgraph, props))
+        definitions.update(mapping.export(exporter, depsgraph, props))
         return self.create_props(props, definitions, luxcore_name)
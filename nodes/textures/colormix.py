@@ -34,6 +34,7 @@ class LuxCoreNodeTexColorMix(LuxCoreNodeTexture, bpy.types.Node):
             self.inputs["Fac"].enabled = False
         utils_node.force_viewport_update(self, context)
 
+    mode_labels = {identifier: name for identifier, name, *_ in mode_items}
     mode: EnumProperty(name="Mode", items=mode_items, default="mix", update=change_mode)
     clamp_output: BoolProperty(update=utils_node.force_viewport_update, name="Clamp", default=False, description="Limit the output value to 0..1 range")
 
@@ -42,9 +43,7 @@ class LuxCoreNodeTexColorMix(LuxCoreNodeTexture, bpy.types.Node):
 
     def draw_label(self):
         # Use the name of the selected operation as displayed node name
-        for elem in self.mode_items:
-            if self.mode in elem:
-                return elem[1]
+        return self.mode_labels.get(self.mode, self.mode)
 
     def init(self, context):
         self.add_input("LuxCoreSocketFloat0to1", "Fac", 1)
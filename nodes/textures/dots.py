@@ -3,6 +3,7 @@ from ..base import LuxCoreNodeTexture
 from ...utils import node as utils_node
 
 class LuxCoreNodeTexDots(LuxCoreNodeTexture, bpy.types.Node):
+    __slots__ = ()
     bl_label = "Dots"
     bl_width_default = 200
     
@@ -17,10 +18,12 @@ class LuxCoreNodeTexDots(LuxCoreNodeTexture, bpy.types.Node):
             utils_node.draw_uv_info(context, layout)
     
     def sub_export(self, exporter, depsgraph, props, luxcore_name=None, output_socket=None):
+        # Sockets in the order they are added in init()
+        inside, outside, mapping = self.inputs
         definitions = {
             "type": "dots",
-            "inside": self.inputs["Inside"].export(exporter, depsgraph, props),
-            "outside": self.inputs["Outside"].export(exporter, depsgraph,  props),
+            "inside": inside.export(exporter, depsgraph, props),
+            "outside": outside.export(exporter, depsgraph, props),
         }
-        definitions.update(self.inputs["2D Mapping"].export(exporter, depsgraph, props))
+        definitions.update(mapping.export(exporter, depsgraph, props))
         return self.create_props(props, definitions, luxcore_name)
@@ -1,7 +1,5 @@
 import bpy
-from bpy.props import EnumProperty
 from ..base import LuxCoreNodeTexture
-from ...utils import node as utils_node
 
 
 class LuxCoreNodeTexHitpointInfo(LuxCoreNodeTexture, bpy.types.Node):
@@ -1,6 +1,6 @@
 import bpy
 from bpy.props import (
-    PointerProperty, EnumProperty, StringProperty, IntProperty,
+    PointerProperty, EnumProperty,
     BoolProperty, FloatProperty,
 )
 from ..base import LuxCoreNodeTexture
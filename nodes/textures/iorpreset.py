@@ -1,4 +1,3 @@
-import bpy
 """A BlendLuxCore node to provide index of refraction preset values for
     LuxCoreRender in Blender"""
 # <pep8 compliant>
@@ -8,6 +7,24 @@ from ..base import LuxCoreNodeTexture
 from ...operators import ior_presets
 from ...utils import node as utils_node
 
+# {node tree pointer: index in bpy.data.node_groups}
+_tree_indices = {}
+
+
+def _get_tree_index(node_tree):
+    node_groups = bpy.data.node_groups
+    pointer = node_tree.as_pointer()
+    index = _tree_indices.get(pointer)
+
+    # The indices shift when node groups are added, removed or renamed (the
+    # collection is sorted by name), so verify the cached index before using it
+    if index is None or index >= len(node_groups) or node_groups[index].as_pointer() != pointer:
+        _tree_indices.clear()
+        _tree_indices.update((tree.as_pointer(), i) for i, tree in enumerate(node_groups))
+        index = _tree_indices.get(pointer)
+
+    return index
+
 
 class LuxCoreNodeTexIORPreset(LuxCoreNodeTexture, bpy.types.Node):
     """ Index of Refraction Preset node """
@@ -57,11 +74,7 @@ class LuxCoreNodeTexIORPreset(LuxCoreNodeTexture, bpy.types.Node):
         op_num = row.operator("luxcore.ior_preset_values", icon="SORTSIZE")
 
         # Get the index of the node tree in bpy.data.node_groups
-        tree_index = None
-        for index, tree in enumerate(bpy.data.node_groups):
-            if tree == self.id_data:
-                tree_index = index
-                break
+        tree_index = _get_tree_index(self.id_data)
 
         for operator in [op_alpha, op_num]:
             operator.node_name = self.name
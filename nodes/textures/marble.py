@@ -1,5 +1,5 @@
 import bpy
-from bpy.props import EnumProperty, FloatProperty, IntProperty
+from bpy.props import FloatProperty, IntProperty
 from ..base import LuxCoreNodeTexture
 from ...utils import node as utils_node
 
@@ -33,5 +33,6 @@ class LuxCoreNodeTexMarble(LuxCoreNodeTexture, bpy.types.Node):
             "scale": self.scale,
             "variation": self.variation,
         }
-        definitions.update(self.inputs["3D Mapping"].export(exporter, depsgraph, props))
+        # The 3D mapping is the only input, no need to search it by name
+        definitions.update(self.inputs[0].export(exporter, depsgraph, props))
         return self.create_props(props, definitions, luxcore_name)
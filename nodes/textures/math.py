@@ -1,7 +1,7 @@
 import bpy
 from bpy.props import EnumProperty, FloatProperty, BoolProperty
 from ..base import LuxCoreNodeTexture
-from ... import utils
+from ...bin import pyluxcore
 from ...ui import icons
 from ...utils import node as utils_node
 
@@ -10,32 +10,13 @@ MIX_DESCRIPTION = (
     "(0 = use first value, 1 = use second value)"
 )
 
+# (name, enabled) of the input sockets 0, 1 and 2 in each mode
+DEFAULT_INPUT_SETTINGS = (("Value 1", True), ("Value 2", True), ("", False))
 INPUT_SETTINGS = {
-    "default": {
-        0: ["Value 1", True], # slot index: [name, enabled]
-        1: ["Value 2", True],
-        2: ["", False]
-    },
-    "abs": {
-        0: ["Value", True],
-        1: ["", False],
-        2: ["", False]
-    },
-    "clamp": {
-        0: ["Value", True],
-        1: ["", False],
-        2: ["", False]
-    },
-    "mix": {
-        0: ["Value 1", True],
-        1: ["Value 2", True],
-        2: ["Fac", True]
-    },
-    "rounding": {
-        0: ["Value", True],
-        1: ["Increment", True],
-        2: ["", False]
-    },
+    "abs": (("Value", True), ("", False), ("", False)),
+    "clamp": (("Value", True), ("", False), ("", False)),
+    "mix": (("Value 1", True), ("Value 2", True), ("Fac", True)),
+    "rounding": (("Value", True), ("Increment", True), ("", False)),
 }
 
 
@@ -44,12 +25,14 @@ class LuxCoreNodeTexMath(LuxCoreNodeTexture, bpy.types.Node):
     bl_label = "Math"
 
     def change_mode(self, context):
-        mode = self.mode if self.mode in INPUT_SETTINGS else "default"
-        current_settings = INPUT_SETTINGS[mode]
+        current_settings = INPUT_SETTINGS.get(self.mode, DEFAULT_INPUT_SETTINGS)
 
-        for i in current_settings.keys():
-            self.inputs[i].name = current_settings[i][0]
-            self.inputs[i].enabled = current_settings[i][1]
+        for socket, (name, enabled) in zip(self.inputs, current_settings):
+            # Only assign on change, every assignment tags the node tree for an update
+            if socket.name != name:
+                socket.name = name
+            if socket.enabled != enabled:
+                socket.enabled = enabled
 
         if self.mode == "rounding":
             # Set a sensible default value for the increment.
@@ -71,6 +54,7 @@ class LuxCoreNodeTexMath(LuxCoreNodeTexture, bpy.types.Node):
         ("rounding", "Round", "Round the input to the nearest increment", 10),
         ("modulo", "Modulo", "Return the remainder of the floating point division Value 1 / Value 2", 11),
     ]
+    mode_labels = {identifier: name for identifier, name, *_ in mode_items}
     mode: EnumProperty(name="Mode", items=mode_items, default="scale", update=change_mode)
 
     mode_clamp_min: FloatProperty(update=utils_node.force_viewport_update, name="Min", description="", default=0)
@@ -89,9 +73,7 @@ class LuxCoreNodeTexMath(LuxCoreNodeTexture, bpy.types.Node):
 
     def draw_label(self):
         # Use the name of the selected operation as displayed node name
-        for elem in self.mode_items:
-            if self.mode in elem:
-                return elem[1]
+        return self.mode_labels.get(self.mode, self.mode)
 
     def draw_buttons(self, context, layout):
         layout.prop(self, "mode", text="")
@@ -110,29 +92,9 @@ class LuxCoreNodeTexMath(LuxCoreNodeTexture, bpy.types.Node):
         definitions = {
             "type": self.mode,
         }
-
-        if self.mode == "abs":
-            definitions["texture"] = self.inputs[0].export(exporter, depsgraph, props)
-        elif self.mode == "clamp":
-            definitions["texture"] = self.inputs[0].export(exporter, depsgraph, props)
-            definitions["min"] = self.mode_clamp_min
-            definitions["max"] = self.mode_clamp_max
-        elif self.mode == "mix":
-            definitions["texture1"] = self.inputs[0].export(exporter, depsgraph, props)
-            definitions["texture2"] = self.inputs[1].export(exporter, depsgraph, props)
-            definitions["amount"] = self.inputs[2].export(exporter, depsgraph, props)
-        elif self.mode == "power":
-            definitions["base"] = self.inputs[0].export(exporter, depsgraph, props)
-            definitions["exponent"] = self.inputs[1].export(exporter, depsgraph, props)
-        elif self.mode == "rounding":
-            definitions["texture"] = self.inputs[0].export(exporter, depsgraph, props)
-            definitions["increment"] = self.inputs[1].export(exporter, depsgraph, props)
-        elif self.mode == "modulo":
-            definitions["texture"] = self.inputs[0].export(exporter, depsgraph, props)
-            definitions["modulo"] = self.inputs[1].export(exporter, depsgraph, props)
-        else:
-            definitions["texture1"] = self.inputs[0].export(exporter, depsgraph, props)
-            definitions["texture2"] = self.inputs[1].export(exporter, depsgraph, props)
+        export_inputs = _MODE_EXPORTERS.get(self.mode, _export_default)
+        # Fetch the socket collection only once, the exporters index it directly
+        export_inputs(self, self.inputs, exporter, depsgraph, props, definitions)
 
         luxcore_name = self.create_props(props, definitions, luxcore_name)
 
@@ -140,15 +102,62 @@ class LuxCoreNodeTexMath(LuxCoreNodeTexture, bpy.types.Node):
             # Implicitly create a clamp texture with unique name
             tex_name = luxcore_name + "_clamp"
             helper_prefix = "scene.textures." + tex_name + "."
-            helper_defs = {
-                "type": "clamp",
-                "texture": luxcore_name,
-                "min": 0,
-                "max": 1,
-            }
-            props.Set(utils.create_props(helper_prefix, helper_defs))
+            # Set these few properties directly, instead of building
+            # a temporary Properties object and merging it into props
+            props.Set(pyluxcore.Property(helper_prefix + "type", "clamp"))
+            props.Set(pyluxcore.Property(helper_prefix + "texture", luxcore_name))
+            props.Set(pyluxcore.Property(helper_prefix + "min", 0))
+            props.Set(pyluxcore.Property(helper_prefix + "max", 1))
 
             # The helper texture gets linked in front of this node
             return tex_name
         else:
             return luxcore_name
+
+
+def _export_default(node, inputs, exporter, depsgraph, props, definitions):
+    definitions["texture1"] = inputs[0].export(exporter, depsgraph, props)
+    definitions["texture2"] = inputs[1].export(exporter, depsgraph, props)
+
+
+def _export_abs(node, inputs, exporter, depsgraph, props, definitions):
+    definitions["texture"] = inputs[0].export(exporter, depsgraph, props)
+
+
+def _export_clamp(node, inputs, exporter, depsgraph, props, definitions):
+    definitions["texture"] = inputs[0].export(exporter, depsgraph, props)
+    definitions["min"] = node.mode_clamp_min
+    definitions["max"] = node.mode_clamp_max
+
+
+def _export_mix(node, inputs, exporter, depsgraph, props, definitions):
+    definitions["texture1"] = inputs[0].export(exporter, depsgraph, props)
+    definitions["texture2"] = inputs[1].export(exporter, depsgraph, props)
+    definitions["amount"] = inputs[2].export(exporter, depsgraph, props)
+
+
+def _export_power(node, inputs, exporter, depsgraph, props, definitions):
+    definitions["base"] = inputs[0].export(exporter, depsgraph, props)
+    definitions["exponent"] = inputs[1].export(exporter, depsgraph, props)
+
+
+def _export_rounding(node, inputs, exporter, depsgraph, props, definitions):
+    definitions["texture"] = inputs[0].export(exporter, depsgraph, props)
+    definitions["increment"] = inputs[1].export(exporter, depsgraph, props)
+
+
+def _export_modulo(node, inputs, exporter, depsgraph, props, definitions):
+    definitions["texture"] = inputs[0].export(exporter, depsgraph, props)
+    definitions["modulo"] = inputs[1].export(exporter, depsgraph, props)
+
+
+# Maps the math mode to the function that exports its inputs,
+# all other modes use _export_default
+_MODE_EXPORTERS = {
+    "abs": _export_abs,
+    "clamp": _export_clamp,
+    "mix": _export_mix,
+    "power": _export_power,
+    "rounding": _export_rounding,
+    "modulo": _export_modulo,
+}
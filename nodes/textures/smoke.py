@@ -1,7 +1,7 @@
 import bpy
 import mathutils
 from time import time
-from bpy.props import EnumProperty, PointerProperty, StringProperty
+from bpy.props import EnumProperty, PointerProperty
 from ..base import LuxCoreNodeTexture
 from ... import utils
 from ...bin import pyluxcore
@@ -97,10 +97,10 @@ class LuxCoreNodeTexSmoke(LuxCoreNodeTexture, bpy.types.Node):
         tex_rot2 = mathutils.Matrix.Rotation(rotate[2], 4, 'Z')
         tex_rot = tex_rot2 @ tex_rot1 @ tex_rot0
 
-        resolution, grid = smoke.convert(domain_eval, output_socket.name, depsgraph)
+        smoke_domain_mod = utils.find_smoke_domain_modifier(domain_eval)
+        resolution, grid = smoke.convert(domain_eval, output_socket.name, depsgraph, smoke_domain_mod)
         nx, ny, nz = resolution
 
-        smoke_domain_mod = utils.find_smoke_domain_modifier(domain_eval)
         grid_name = output_socket.name
         cell_size = mathutils.Vector((0, 0, 0))
         amplify = 1
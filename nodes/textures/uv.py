@@ -10,8 +10,8 @@ class LuxCoreNodeTexUV(LuxCoreNodeTexture, bpy.types.Node):
         self.outputs.new("LuxCoreSocketColor", "Color")
 
     def sub_export(self, exporter, depsgraph, props, luxcore_name=None, output_socket=None):
-        definitions = {
-            "type": "uv",
-        }
-        definitions.update(self.inputs["2D Mapping"].export(exporter, depsgraph, props))
+        # The 2D mapping is the only input, no need to search it by name.
+        # Its export returns a new dict, so we can add our own definitions to it
+        definitions = self.inputs[0].export(exporter, depsgraph, props)
+        definitions["type"] = "uv"
         return self.create_props(props, definitions, luxcore_name)
@@ -1,5 +1,5 @@
 import bpy
-from bpy.props import BoolProperty, EnumProperty, FloatProperty
+from bpy.props import EnumProperty, FloatProperty
 from ..base import LuxCoreNodeTexture
 from ...ui import icons
 from .math import MIX_DESCRIPTION
@@ -34,6 +34,7 @@ class LuxCoreNodeTexVectorMath(LuxCoreNodeTexture, bpy.types.Node):
 
         utils_node.force_viewport_update(self, context)
 
+    mode_labels = {identifier: name for identifier, name, *_ in mode_items}
     mode: EnumProperty(name="Mode", items=mode_items, default="scale", update=change_mode)
 
     mode_clamp_min: FloatProperty(update=utils_node.force_viewport_update, name="Min", description="", default=0)
@@ -41,9 +42,7 @@ class LuxCoreNodeTexVectorMath(LuxCoreNodeTexture, bpy.types.Node):
 
     def draw_label(self):
         # Use the name of the selected operation as displayed node name
-        for elem in self.mode_items:
-            if self.mode in elem:
-                return elem[1]
+        return self.mode_labels.get(self.mode, self.mode)
 
     def init(self, context):
         self.add_input("LuxCoreSocketFloat0to1", "Fac", 1)
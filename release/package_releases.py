@@ -4,15 +4,14 @@
 
 import argparse
 import os
-import urllib.request
-import urllib.error
 import subprocess
 import shutil
-import tarfile
-import zipfile
 import stat
 import uuid
 import platform
+from concurrent.futures import ThreadPoolExecutor
+# tarfile, zipfile and urllib are imported in the functions that use them,
+# so e.g. --help does not have to load them
 
 # From https://docs.python.org/3/library/shutil.html#rmtree-example
 def remove_readonly(func, path, _):
@@ -74,6 +73,11 @@ MAC_FILES = [
 OIDN_LINUX = "oidn-linux.tar.gz"
 OIDN_LINUX_URL = "https://github.com/OpenImageDenoise/oidn/releases/download/v1.3.0/oidn-1.3.0.x86_64.linux.tar.gz"
 
+COPY_BUFFER_SIZE = 1024 * 1024
+
+# Developer stuff in the repository root that is not needed by users
+DEVELOPER_DIRS = frozenset((".git", ".github", "doc", "scripts"))
+
 
 def print_divider():
     print("=" * 60)
@@ -88,45 +92,49 @@ def build_zip_name(version_string, suffix):
     return "BlendLuxCore-" + version_string + suffix_without_extension
 
 
-def extract_files_from_tar(tar_path, files_to_extract, destination):
-    # have to use a temp dir (weird extract behaviour)
-    temp_dir = os.path.join(script_dir, "temp")
-    # Make sure we don't delete someone's beloved temp folder later
-    while os.path.exists(temp_dir):
-        temp_dir += "_"
-    os.mkdir(temp_dir)
+# Note: the members are streamed directly into the destination directory, because
+# extracting them would recreate the directory structure of the archive
 
+def extract_files_from_tar(tar_path, files_to_extract, destination):
+    import tarfile
+    remaining = set(files_to_extract)
     print("Reading tar file:", tar_path)
 
     tar_type = os.path.splitext(tar_path)[1][1:]
     with tarfile.open(tar_path, "r:" + tar_type) as tar:
-        for member in tar.getmembers():
+        # Read the member headers lazily, so we can stop as soon as we have all files
+        for member in tar:
+            if not remaining:
+                break
+
             basename = os.path.basename(member.name)
-            if basename not in files_to_extract:
+            if basename not in remaining:
                 continue
 
-            # have to use a temp dir (weird extract behaviour)
-            print('Extracting "%s" to "%s"' % (basename, temp_dir))
-            tar.extract(member, path=temp_dir)
-            src = os.path.join(temp_dir, member.name)
-
-            # move to real target directory
             dst = os.path.join(destination, basename)
-            print('Moving "%s" to "%s"' % (src, dst))
-            if not os.path.isfile(dst):
-                shutil.move(src, dst)
+            if os.path.isfile(dst):
+                remaining.discard(basename)
+                continue
 
-    rmtree(temp_dir)
+            # Links are resolved to the file they point to
+            src_file = tar.extractfile(member)
+            if src_file is None:
+                # Not a file (e.g. a directory)
+                continue
 
+            print('Extracting "%s" to "%s"' % (member.name, dst))
+            with src_file, open(dst, "wb") as dst_file:
+                shutil.copyfileobj(src_file, dst_file, COPY_BUFFER_SIZE)
 
-def extract_files_from_zip(zip_path, files_to_extract, destination):
-    # have to use a temp dir (weird extract behaviour)
-    temp_dir = os.path.join(script_dir, "temp")
-    # Make sure we don't delete someone's beloved temp folder later
-    while os.path.exists(temp_dir):
-        temp_dir += "_"
-    os.mkdir(temp_dir)
+            if member.isfile():
+                # Keep the executable bit, e.g. of oidnDenoise
+                os.chmod(dst, member.mode)
+            remaining.discard(basename)
 
+
+def extract_files_from_zip(zip_path, files_to_extract, destination):
+    import zipfile
+    files_to_extract = frozenset(files_to_extract)
     print("Reading zip file:", zip_path)
 
     with zipfile.ZipFile(zip_path, "r") as zip:
@@ -135,16 +143,10 @@ def extract_files_from_zip(zip_path, files_to_extract, destination):
             if basename not in files_to_extract:
                 continue
 
-            # have to use a temp dir (weird extract behaviour)
-            print('Extracting "%s" to "%s"' % (basename, temp_dir))
-            src = zip.extract(member, path=temp_dir)
-
-            # move to real target directory
             dst = os.path.join(destination, basename)
-            print('Moving "%s" to "%s"' % (src, dst))
-            shutil.move(src, dst)
-
-    rmtree(temp_dir)
+            print('Extracting "%s" to "%s"' % (member, dst))
+            with zip.open(member) as src_file, open(dst, "wb") as dst_file:
+                shutil.copyfileobj(src_file, dst_file, COPY_BUFFER_SIZE)
 
 
 def extract_files_from_dmg(dmg_path, files_to_extract, destination):
@@ -210,10 +212,78 @@ def extract_luxcore_zip(prefix, platform_suffixes, file_names, version_string):
         extract_files_from_archive(zip_name, file_names, destination)
 
 
+def ignore_developer_dirs(repo_path):
+    """ Returns an ignore function for shutil.copytree that skips DEVELOPER_DIRS in repo_path """
+    def ignore(directory, names):
+        # Only ignore them at the top level, not e.g. a "doc" folder in a subdirectory
+        if directory == repo_path:
+            return DEVELOPER_DIRS.intersection(names)
+        return ()
+    return ignore
+
+
+def iter_files(directory, arc_prefix=""):
+    """
+    Yields (path, archive name) of all directories and regular files below directory,
+    the same entries shutil.make_archive() stores. Directory names end with "/".
+    Like os.walk, symlinks to directories are not followed.
+    Anything else, e.g. broken symlinks, is skipped.
+    """
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            arcname = arc_prefix + entry.name
+            if entry.is_dir():
+                # Directory entries keep empty and symlinked folders in the archive
+                yield entry.path, arcname + "/"
+                if entry.is_dir(follow_symlinks=False):
+                    yield from iter_files(entry.path, arcname + "/")
+            elif entry.is_file():
+                yield entry.path, arcname
+
+
+def zip_directory(directory, zip_path, compresslevel=None):
+    """ Packs the contents of directory into a zip file, paths are stored relative to directory """
+    import zipfile
+    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED,
+                         compresslevel=compresslevel, strict_timestamps=False) as zip:
+        for path, arcname in iter_files(directory):
+            zip.write(path, arcname)
+
+
+def download_luxcore_archive(url_prefix, prefix, version_string, suffix, existing_files):
+    """
+    Downloads the LuxCore archive for one platform suffix.
+    existing_files: names of the files in script_dir before the downloads started
+    Returns False if the archive is not available for download.
+    """
+    import urllib.request
+    import urllib.error
+    name = build_name(prefix, version_string, suffix)
+
+    # Check if file already downloaded
+    if name in existing_files:
+        print('File already downloaded: "%s"' % name)
+        return True
+
+    destination = os.path.join(script_dir, name)
+    url = url_prefix + version_string + "/" + name
+    print('Downloading: "%s"' % url)
+
+    try:
+        urllib.request.urlretrieve(url, destination)
+    except urllib.error.HTTPError as error:
+        print(error)
+        print("Archive", name, "not available, skipping it.")
+        return False
+    return True
+
+
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("version_string",
                         help='E.g. "v2.0alpha1" or "v2.0". Used to download the LuxCore zips')
+    parser.add_argument("--fast", action="store_true",
+                        help="Use the fastest zip compression (larger files), e.g. for test builds")
     args = parser.parse_args()
 
     # Archives we need.
@@ -235,28 +305,18 @@ def main():
     print("Downloading LuxCore releases")
     print_divider()
 
-    to_remove = []
-    for suffix in suffixes:
-        name = build_name(prefix, args.version_string, suffix)
-
-        # Check if file already downloaded
-        if name in os.listdir(script_dir):
-            print('File already downloaded: "%s"' % name)
-        else:
-            destination = os.path.join(script_dir, name)
-            url = url_prefix + args.version_string + "/" + name
-            print('Downloading: "%s"' % url)
-
-            try:
-                urllib.request.urlretrieve(url, destination)
-            except urllib.error.HTTPError as error:
-                print(error)
-                print("Archive", name, "not available, skipping it.")
-                to_remove.append(suffix)
+    # Only list the directory once, the archives are the only files added to it later
+    existing_files = frozenset(os.listdir(script_dir))
+
+    # The downloads are independent of each other, so run them in parallel
+    with ThreadPoolExecutor(max_workers=len(suffixes)) as executor:
+        available = list(executor.map(
+            lambda suffix: download_luxcore_archive(url_prefix, prefix, args.version_string,
+                                                    suffix, existing_files),
+            suffixes))
 
     # Remove suffixes that were not available for download
-    for suffix in to_remove:
-        suffixes.remove(suffix)
+    suffixes = [suffix for suffix, is_available in zip(suffixes, available) if is_available]
 
     print()
     print_divider()
@@ -266,7 +326,7 @@ def main():
     # Clone BlendLuxCore (will later put the binaries in there)
     repo_path = os.path.join(script_dir, "BlendLuxCore")
     if os.path.exists(repo_path):
-        # Clone fresh because we delete some stuff after cloning
+        # Clone fresh, git clone needs an empty destination and we want no local changes in the release
         print('Destinaton already exists, deleting it: "%s"' % repo_path)
         rmtree(repo_path)
 
@@ -291,22 +351,13 @@ def main():
 
     os.chdir("..")
 
-    # Delete developer stuff that is not needed by users
-    to_delete = [
-        os.path.join(repo_path, "doc"),
-        os.path.join(repo_path, ".github"),
-        os.path.join(repo_path, ".git"),
-        os.path.join(repo_path, "scripts"),
-    ]
-    for path in to_delete:
-        rmtree(path)
-
     print()
     print_divider()
     print("Creating BlendLuxCore release subdirectories")
     print_divider()
 
-    # Create subdirectories for all platforms
+    # Create subdirectories for all platforms, without the developer stuff
+    ignore = ignore_developer_dirs(repo_path)
     for suffix in suffixes:
         name = build_zip_name(args.version_string, suffix)
         destination = os.path.join(script_dir, name, "BlendLuxCore")
@@ -316,7 +367,7 @@ def main():
             print("(Already exists, cleaning it)")
             rmtree(destination)
 
-        shutil.copytree(repo_path, destination)
+        shutil.copytree(repo_path, destination, ignore=ignore)
 
     print()
     print_divider()
@@ -324,9 +375,11 @@ def main():
     print_divider()
 
     # Check if file already downloaded
-    if OIDN_LINUX in os.listdir(script_dir):
+    if OIDN_LINUX in existing_files:
         print('File already downloaded: "%s"' % OIDN_LINUX)
     else:
+        import urllib.request
+        import urllib.error
         destination = os.path.join(script_dir, OIDN_LINUX)
         try:
             urllib.request.urlretrieve(OIDN_LINUX_URL, destination)
@@ -370,15 +423,16 @@ def main():
         rmtree(release_dir)
     os.mkdir(release_dir)
 
+    # None means zlib's default level
+    compresslevel = 1 if args.fast else None
+
     for suffix in suffixes:
         name = build_zip_name(args.version_string, suffix)
         zip_this = os.path.join(script_dir, name)
         print("Zipping:", name)
         zip_name = name + ".zip"
 
-        shutil.make_archive(name, 'zip', zip_this)
-
-        shutil.move(zip_this + ".zip", os.path.join(release_dir, zip_name))
+        zip_directory(zip_this, os.path.join(release_dir, zip_name), compresslevel)
 
     print()
     print_divider()
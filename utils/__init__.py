@@ -2,24 +2,34 @@ import bpy
 import mathutils
 import math
 import re
-import hashlib
+import zlib
 import os
 from os.path import basename, dirname
+from functools import lru_cache
 from ..bin import pyluxcore
 from . import view_layer
 
 MESH_OBJECTS = {"MESH", "CURVE", "SURFACE", "META", "FONT"}
 EXPORTABLE_OBJECTS = MESH_OBJECTS | {"LIGHT"}
 NON_DEFORMING_MODIFIERS = {"COLLISION", "PARTICLE_INSTANCE", "PARTICLE_SYSTEM", "SMOKE"}
+# Name of the addon folder, used as key in context.preferences.addons
+_ADDON_NAME = basename(dirname(dirname(__file__)))
 
 
+_ILLEGAL_NAME_CHARS = re.compile("[^_0-9a-zA-Z]+")
+
+
+@lru_cache(maxsize=4096)
 def sanitize_luxcore_name(string):
     """
     Do NOT use this function to create a luxcore name for an object/material/etc.!
     Use the function get_luxcore_name() instead.
     This is just a regex that removes non-allowed characters.
+    The results are cached because the same names are requested over and over during export.
     """
-    return re.sub("[^_0-9a-zA-Z]+", "__", string)
+    if not _ILLEGAL_NAME_CHARS.search(string):
+        return string
+    return _ILLEGAL_NAME_CHARS.sub("__", string)
 
 
 def make_key(datablock):
@@ -37,9 +47,9 @@ def make_key_from_bpy_struct(bpy_struct):
 
 def make_key_from_instance(dg_obj_instance):
     if dg_obj_instance.is_instance:
-        key = make_key(dg_obj_instance.object)
-        key += "_" + make_key(dg_obj_instance.parent)
-        key += persistent_id_to_str(dg_obj_instance.persistent_id)
+        # One f-string instead of building the key with repeated concatenations
+        key = (f"{make_key(dg_obj_instance.object)}_{make_key(dg_obj_instance.parent)}"
+               f"{persistent_id_to_str(dg_obj_instance.persistent_id)}")
     else:
         key = make_key(dg_obj_instance.object.original)
     return key
@@ -71,11 +81,12 @@ def get_luxcore_name(datablock, is_viewport_render=True):
     """
     key = make_key(datablock)
 
-    if not is_viewport_render:
-        # Final render - we can use pretty names
-        key = get_pretty_name(datablock) + key
+    if is_viewport_render:
+        # The key is a memory address, it only contains digits
+        return key
 
-    return sanitize_luxcore_name(key)
+    # Final render - we can use pretty names
+    return sanitize_luxcore_name(get_pretty_name(datablock) + key)
 
 
 def obj_from_key(key, objects):
@@ -88,7 +99,7 @@ def obj_from_key(key, objects):
 def persistent_id_to_str(persistent_id):
     # Apparently we need all entries in persistent_id, otherwise
     # there are collisions when instances are nested
-    return "_".join([str(pid) for pid in persistent_id])
+    return "_".join(map(str, persistent_id))
 
 
 def make_object_id(dg_obj_instance):
@@ -100,15 +111,18 @@ def make_object_id(dg_obj_instance):
         # random_id seems to be a 4-Byte integer in range -0xffffffff to 0xffffffff.
         return dg_obj_instance.random_id & 0xfffffffe
 
-    key = dg_obj_instance.object.original.name
+    return _hash_object_name(dg_obj_instance.object.original.name)
 
+
+@lru_cache(maxsize=4096)
+def _hash_object_name(name):
     # We do this similar to Cycles: hash the object's name to get an ID that's stable over
     # frames and between re-renders (as long as the object is not renamed).
-    digest = hashlib.md5(key.encode("utf-8")).digest()
-    as_int = int.from_bytes(digest, byteorder="little")
-    # Truncate to 4 bytes because LuxCore uses unsigned int for the object ID.
+    # A cryptographic hash is not needed for this, CRC32 already gives us 4 bytes.
+    as_int = zlib.crc32(name.encode("utf-8"))
+    # LuxCore uses unsigned int for the object ID.
     # Make sure it's not exactly 0xffffffff because that's LuxCore's Null index for object IDs.
-    return min(as_int & 0xffffffff, 0xffffffff - 1)
+    return min(as_int, 0xffffffff - 1)
 
 
 def create_props(prefix, definitions):
@@ -132,11 +146,12 @@ def matrix_to_list(matrix, invert=False):
     Returns list[16]
     """
     # Copy required for BlenderMatrix4x4ToList(), not sure why, but if we don't
-    # make a copy, we only get an identity matrix in C++
-    matrix = matrix.copy()
-
+    # make a copy, we only get an identity matrix in C++.
+    # inverted_safe() already returns a new matrix, so no extra copy is needed in this case.
     if invert:
-        matrix.invert_safe()
+        matrix = matrix.inverted_safe()
+    else:
+        matrix = matrix.copy()
 
     return pyluxcore.BlenderMatrix4x4ToList(matrix)
 
@@ -211,36 +226,30 @@ def calc_filmsize(scene, context=None):
     return width, height
 
 
-def calc_blender_border(scene, context=None):
-    render = scene.render
+_FULL_BORDER = (0, 1, 0, 1)
+
 
+def calc_blender_border(scene, context=None):
+    """ Returns a tuple (min_x, max_x, min_y, max_y) """
+    # Most of the time there is no border, in this case the values are not read at all
     if context and context.region_data.view_perspective in ("ORTHO", "PERSP"):
         # Viewport camera
-        border_max_x = context.space_data.render_border_max_x
-        border_max_y = context.space_data.render_border_max_y
-        border_min_x = context.space_data.render_border_min_x
-        border_min_y = context.space_data.render_border_min_y
+        space = context.space_data
+        if not space.use_render_border:
+            return _FULL_BORDER
+        blender_border = (space.render_border_min_x, space.render_border_max_x,
+                          space.render_border_min_y, space.render_border_max_y)
     else:
         # Final camera
-        border_max_x = render.border_max_x
-        border_max_y = render.border_max_y
-        border_min_x = render.border_min_x
-        border_min_y = render.border_min_y
-
-    if context and context.region_data.view_perspective in ("ORTHO", "PERSP"):
-        use_border = context.space_data.use_render_border
-    else:
-        use_border = render.use_border
-
-    if use_border:
-        blender_border = [border_min_x, border_max_x, border_min_y, border_max_y]
-        # Round all values to avoid running into problems later
-        # when a value is for example 0.699999988079071
-        blender_border = [round(value, 6) for value in blender_border]
-    else:
-        blender_border = [0, 1, 0, 1]
+        render = scene.render
+        if not render.use_border:
+            return _FULL_BORDER
+        blender_border = (render.border_min_x, render.border_max_x,
+                          render.border_min_y, render.border_max_y)
 
-    return blender_border
+    # Round all values to avoid running into problems later
+    # when a value is for example 0.699999988079071
+    return tuple(round(value, 6) for value in blender_border)
 
 
 def calc_screenwindow(zoom, shift_x, shift_y, scene, context=None):
@@ -293,24 +302,27 @@ def calc_screenwindow(zoom, shift_x, shift_y, scene, context=None):
         if scene.camera and scene.camera.data.type == "ORTHO":                    
             scale = 0.5 * scene.camera.data.ortho_scale                
 
+    return _screenwindow_with_border(zoom, scale, shift_x, shift_y, offset_x, offset_y, xaspect, yaspect,
+                                     border_min_x, border_max_x, border_min_y, border_max_y)
+
+
+def _screenwindow_with_border(zoom, scale, shift_x, shift_y, offset_x, offset_y, xaspect, yaspect,
+                              border_min_x, border_max_x, border_min_y, border_max_y):
+    """ The numeric part of calc_screenwindow(), only works on plain floats """
     dx = scale * 2 * (shift_x + 2 * xaspect * offset_x)
     dy = scale * 2 * (shift_y + 2 * yaspect * offset_y)
 
-    screenwindow = [
-        -xaspect*zoom + dx,
-         xaspect*zoom + dx,
-        -yaspect*zoom + dy,
-         yaspect*zoom + dy
-    ]
-    
-    screenwindow = [
-        screenwindow[0] * (1 - border_min_x) + screenwindow[1] * border_min_x,
-        screenwindow[0] * (1 - border_max_x) + screenwindow[1] * border_max_x,
-        screenwindow[2] * (1 - border_min_y) + screenwindow[3] * border_min_y,
-        screenwindow[2] * (1 - border_max_y) + screenwindow[3] * border_max_y
+    left = -xaspect*zoom + dx
+    right = xaspect*zoom + dx
+    bottom = -yaspect*zoom + dy
+    top = yaspect*zoom + dy
+
+    return [
+        left * (1 - border_min_x) + right * border_min_x,
+        left * (1 - border_max_x) + right * border_max_x,
+        bottom * (1 - border_min_y) + top * border_min_y,
+        bottom * (1 - border_max_y) + top * border_max_y
     ]
-    
-    return screenwindow
 
 
 def calc_aspect(width, height, fit="AUTO"):
@@ -367,12 +379,17 @@ def is_obj_visible(obj):
     return is_obj_visible_in_cycles(obj)
 
 
-def is_obj_visible_in_cycles(obj):
-    if bpy.app.version[:2] < (3, 0):
+# The Blender version can't change at runtime, so the implementation is chosen once at import.
+# Short-circuit instead of any((...)), so usually only the first attribute has to be fetched
+if bpy.app.version[:2] < (3, 0):
+    def is_obj_visible_in_cycles(obj):
         c_vis = obj.cycles_visibility
-        return any((c_vis.camera, c_vis.diffuse, c_vis.glossy, c_vis.transmission, c_vis.scatter, c_vis.shadow))
-    else:
-        return any((obj.visible_camera, obj.visible_diffuse, obj.visible_glossy, obj.visible_transmission, obj.visible_volume_scatter, obj.visible_shadow))
+        return (c_vis.camera or c_vis.diffuse or c_vis.glossy or c_vis.transmission
+                or c_vis.scatter or c_vis.shadow)
+else:
+    def is_obj_visible_in_cycles(obj):
+        return (obj.visible_camera or obj.visible_diffuse or obj.visible_glossy or obj.visible_transmission
+                or obj.visible_volume_scatter or obj.visible_shadow)
 
 
 
@@ -386,15 +403,29 @@ def visible_to_camera(dg_obj_instance, is_viewport_render, view_layer=None):
 
 
 def get_theme(context):
-    current_theme_name = context.preferences.themes.items()[0][0]
-    return context.preferences.themes[current_theme_name]
+    # The active theme is always the first one
+    return context.preferences.themes[0]
+
+
+@lru_cache(maxsize=4096)
+def _abspath_cached(path, lib_path, blend_path):
+    """
+    The result of bpy.path.abspath() only depends on the path, the library filepath
+    and the filepath of the current .blend, so all of them are part of the cache key.
+    The cache can't return stale paths after the .blend is saved elsewhere or a new one is loaded.
+    """
+    if lib_path is None:
+        return bpy.path.abspath(path)
+    # Same as what bpy.path.abspath() does with the library argument
+    return bpy.path.abspath(path, start=os.path.dirname(bpy.path.abspath(lib_path)))
 
 
 def get_abspath(path, library=None, must_exist=False, must_be_existing_file=False, must_be_existing_dir=False):
     """ library: The library this path is from. """
     assert not (must_be_existing_file and must_be_existing_dir)
 
-    abspath = bpy.path.abspath(path, library=library)
+    lib_path = library.filepath if library else None
+    abspath = _abspath_cached(path, lib_path, bpy.data.filepath)
 
     if must_be_existing_file and not os.path.isfile(abspath):
         raise OSError('Not an existing file: "%s"' % abspath)
@@ -410,22 +441,22 @@ def get_abspath(path, library=None, must_exist=False, must_be_existing_file=Fals
 
 def absorption_at_depth_scaled(abs_col, depth, scale=1):
     assert depth > 0
-    abs_col = list(abs_col)
+    abs_col = [float(v) for v in abs_col]
     assert len(abs_col) == 3
 
-    scaled = [0, 0, 0]
-    for i in range(len(abs_col)):
-        v = float(abs_col[i])
-        scaled[i] = (-math.log(max([v, 1e-30])) / depth) * scale * (v == 1.0 and -1 or 1)
-
-    return scaled
+    # The sign flip for v == 1.0 turns -0.0 into 0.0
+    return [(-math.log(max(v, 1e-30)) / depth) * scale * (-1 if v == 1.0 else 1) for v in abs_col]
 
 
 def all_elems_equal(_list):
     # https://stackoverflow.com/a/10285205
     # The list must not be empty!
+    # A plain loop avoids the generator overhead of all(), lists are usually short
     first = _list[0]
-    return all(x == first for x in _list)
+    for i in range(1, len(_list)):
+        if _list[i] != first:
+            return False
+    return True
 
 
 def use_obj_motion_blur(obj, scene):
@@ -442,11 +473,13 @@ def use_obj_motion_blur(obj, scene):
 
 
 def has_deforming_modifiers(obj):
-    return any([mod.type not in NON_DEFORMING_MODIFIERS for mod in obj.modifiers])
+    # Generator instead of list so any() can stop at the first deforming modifier
+    return any(mod.type not in NON_DEFORMING_MODIFIERS for mod in obj.modifiers)
 
 
 def can_share_mesh(obj):
-    if not obj.data or obj.data.users < 2:
+    data = obj.data
+    if not data or data.users < 2:
         return False
     return not has_deforming_modifiers(obj)
 
@@ -467,16 +500,19 @@ def use_instancing(obj, scene, is_viewport_render):
     return False
 
 
-def find_smoke_domain_modifier(obj):
-    if bpy.app.version[:2] < (2, 82):
-        for mod in obj.modifiers:
-            if mod.type == "SMOKE" and mod.smoke_type == "DOMAIN":
-                return mod
-    else:
-        for mod in obj.modifiers:
-            if mod.type == "FLUID" and mod.fluid_type == "DOMAIN":
-                return mod
+# The smoke modifier was replaced by the fluid modifier in Blender 2.82
+if bpy.app.version[:2] < (2, 82):
+    def _is_smoke_domain(mod):
+        return mod.type == "SMOKE" and mod.smoke_type == "DOMAIN"
+else:
+    def _is_smoke_domain(mod):
+        return mod.type == "FLUID" and mod.fluid_type == "DOMAIN"
+
 
+def find_smoke_domain_modifier(obj):
+    for mod in obj.modifiers:
+        if _is_smoke_domain(mod):
+            return mod
     return None
 
 
@@ -493,7 +529,9 @@ def get_name_with_lib(datablock):
 
 
 def clamp(value, _min=0, _max=1):
-    return max(_min, min(_max, value))
+    # Same as max(_min, min(_max, value)), but conditional expressions are faster than the builtins
+    value = _max if value > _max else value
+    return _min if value < _min else value
 
 
 def using_filesaver(is_viewport_render, scene):
@@ -539,12 +577,14 @@ def is_pixel_filtering_forced_disabled(scene, denoiser_enabled):
 def get_halt_conditions(scene):
     render_layer = view_layer.get_current_view_layer(scene)
 
-    if render_layer and render_layer.luxcore.halt.enable:
-        # Global halt conditions are overridden by this render layer
-        return render_layer.luxcore.halt
-    else:
-        # Use global halt conditions
-        return scene.luxcore.halt
+    if render_layer:
+        layer_halt = render_layer.luxcore.halt
+        if layer_halt.enable:
+            # Global halt conditions are overridden by this render layer
+            return layer_halt
+
+    # Use global halt conditions
+    return scene.luxcore.halt
 
 
 def use_two_tiled_passes(scene):
@@ -564,10 +604,14 @@ def pluralize(format_str, amount):
     return formatted
 
 
+# The loaded pyluxcore binary can't change during a session, so it's enough to query these once
+
+@lru_cache(maxsize=None)
 def is_opencl_build():
     return pyluxcore.GetPlatformDesc().Get("compile.LUXRAYS_ENABLE_OPENCL").GetBool()
-    
-    
+
+
+@lru_cache(maxsize=None)
 def is_cuda_build():
     return pyluxcore.GetPlatformDesc().Get("compile.LUXRAYS_ENABLE_CUDA").GetBool()
 
@@ -591,19 +635,29 @@ def image_sequence_resolve_all(image):
         # Input isn't from a sequence
         return []
 
+    index_start = len(filename_nodigits)
+    index_end = -len(ext) if ext else -1
+
     indexed_filepaths = []
-    for f in os.scandir(basedir):
-        index_str = f.name[len(filename_nodigits):-len(ext) if ext else -1]
+    for entry in os.scandir(basedir):
+        # Cheap string tests first, is_file() might need a stat call on some filesystems
+        name = entry.name
+        if not (name.startswith(filename_nodigits) and name.endswith(ext)):
+            continue
 
-        if (f.is_file()
-                and f.name.startswith(filename_nodigits)
-                and f.name.endswith(ext)
-                and index_str.isdigit()):
-            elem = (int(index_str), f.path)
-            indexed_filepaths.append(elem)
+        index_str = name[index_start:index_end]
+        if index_str.isdigit() and entry.is_file():
+            indexed_filepaths.append((int(index_str), entry.path))
 
     return sorted(indexed_filepaths, key=lambda elem: elem[0])
 
+
+# Blender cache files are named name_frame_index.ext
+_BLENDER_CACHE_SEQUENCE = re.compile(r'(.*)_([0-9]{6})_([0-9]{2})')
+# General sequence, e.g. name001.ext
+_GENERAL_SEQUENCE = re.compile(r'(\D*)([0-9]+)')
+
+
 def openVDB_sequence_resolve_all(file):
     filepath = get_abspath(file)
     basedir, filename = os.path.split(filepath)
@@ -613,13 +667,13 @@ def openVDB_sequence_resolve_all(file):
     # in case of the Blender cache files the structure is name_frame_index.ext
 
     # Test if the filename structure matches the Blender nomenclature
-    matchstr = r'(.*)_([0-9]{6})_([0-9]{2})'
-    matchObj = re.match(matchstr, filename_noext)
+    pattern = _BLENDER_CACHE_SEQUENCE
+    matchObj = pattern.match(filename_noext)
 
     if not matchObj:
-        matchstr = r'(\D*)([0-9]+)'
+        pattern = _GENERAL_SEQUENCE
         # Test if the filename structure matches a general sequence structure
-        matchObj = re.match(matchstr, filename_noext)
+        matchObj = pattern.match(filename_noext)
 
     if matchObj:
         name = matchObj.group(1)
@@ -628,12 +682,15 @@ def openVDB_sequence_resolve_all(file):
         return []
 
     indexed_filepaths = []
-    for f in os.scandir(basedir):
-        filename_noext2, ext2 = os.path.splitext(f.name)
+    for entry in os.scandir(basedir):
+        # Cheap string tests first, only candidates are checked with the regex
+        if not (entry.name.startswith(name) and entry.name.endswith(ext)):
+            continue
+        filename_noext2, ext2 = os.path.splitext(entry.name)
         if ext == ext2:
-            matchObj = re.match(matchstr, filename_noext2)
-            if matchObj and name == matchObj.group(1):
-                elem = (int(matchObj.group(2)), f.path)
+            matchObj = pattern.match(filename_noext2)
+            if matchObj and name == matchObj.group(1) and entry.is_file():
+                elem = (int(matchObj.group(2)), entry.path)
                 indexed_filepaths.append(elem)
 
     return sorted(indexed_filepaths, key=lambda elem: elem[0])
@@ -672,8 +729,7 @@ def in_material_shading_mode(context):
 
 
 def get_addon_preferences(context):
-    addon_name = basename(dirname(dirname(__file__)))
-    return context.preferences.addons[addon_name].preferences
+    return context.preferences.addons[_ADDON_NAME].preferences
 
 
 def count_index(func):